@@ -144,6 +144,7 @@ def get_synonyms(prefix: str, identifier: str) -> Optional[List[str]]:
     return _help_get(get_id_synonyms_mapping, prefix, identifier)
 
 
+@lru_cache()
 @wrap_norm_prefix
 def get_id_synonyms_mapping(prefix: str, force: bool = False) -> Mapping[str, List[str]]:
     """Get the OBO file and output a synonym dictionary."""
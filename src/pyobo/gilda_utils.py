@@ -2,19 +2,21 @@
 
 """PyOBO's Gilda utilities."""
 
-from typing import Iterable, Optional, Tuple, Union
+import re
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, List, Mapping, Optional, Tuple, Union
 
 import bioregistry
 import gilda.api
 import gilda.term
-from gilda.generate_terms import filter_out_duplicates
 from gilda.grounder import Grounder
 from gilda.process import normalize
 from tqdm import tqdm
 
 from pyobo import get_id_name_mapping, get_id_synonyms_mapping, get_ids
 from pyobo.getters import NoBuild
-from pyobo.utils.io import multidict
 
 __all__ = [
     "iter_gilda_prediction_tuples",
@@ -68,15 +70,24 @@ def iter_gilda_prediction_tuples(
 def normalize_identifier(prefix: str, identifier: str) -> str:
     """Normalize the identifier."""
     # TODO in bioregistry.resolve_identifier there is similar code. just combine with that
+    rule = _get_banana_rule(prefix)
+    if rule is not None:
+        banana, addition = rule
+        if not identifier.startswith(banana):
+            return f"{addition}{identifier}"
+    return identifier
+
+
+@lru_cache(maxsize=None)
+def _get_banana_rule(prefix: str) -> Optional[Tuple[str, str]]:
+    """Get the string identifiers should start with and what to prepend if they don't."""
     banana = bioregistry.get_banana(prefix)
     if banana:
-        if not identifier.startswith(banana):
-            return f"{banana}:{identifier}"
-    elif bioregistry.namespace_in_lui(prefix):
+        return banana, f"{banana}:"
+    if bioregistry.namespace_in_lui(prefix):
         banana = f"{prefix.upper()}:"
-        if not identifier.startswith(banana):
-            return f"{banana}{identifier}"
-    return identifier
+        return banana, banana
+    return None
 
 
 def get_grounder(
@@ -87,55 +98,120 @@ def get_grounder(
     if isinstance(prefix, str):
         prefix = [prefix]
 
-    terms = []
+    # Deduplicate in a single pass. Since names are generated before synonyms and
+    # identifiers, keeping the first occurrence of each term gives the same priority
+    # as :func:`gilda.generate_terms.filter_out_duplicates`. Gilda terms are only
+    # constructed for the tuples that survive deduplication.
+    # The prefixes are loaded one at a time, since loading one can load others
+    # (e.g., HGNC loads MGI's names) and the caches aren't safe to build concurrently.
+    seen = set()
+    rows = []
     for p in prefix:
         try:
-            p_terms = list(get_gilda_terms(p, identifiers_are_names=p in unnamed))
+            p_rows = list(_iter_gilda_term_tuples(p, identifiers_are_names=p in unnamed))
         except NoBuild:
             continue
-        else:
-            terms.extend(p_terms)
-    terms = filter_out_duplicates(terms)
-    terms = multidict((term.norm_text, term) for term in terms)
-    return Grounder(terms)
-
-
-def get_gilda_terms(prefix: str, identifiers_are_names: bool = False) -> Iterable[gilda.term.Term]:
-    """Get gilda terms for the given namespace."""
-    id_to_name = get_id_name_mapping(prefix)
+        for norm_text, text, identifier, entry_name, status in p_rows:
+            key = p, identifier, text
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append((text, p, identifier, norm_text, entry_name, status))
+
+    # sort by text, prefix, and identifier like filter_out_duplicates does, so the
+    # terms for each normalized text are in the same order
+    rows.sort(key=itemgetter(0, 1, 2))
+    terms = defaultdict(list)
+    for text, p, identifier, norm_text, entry_name, status in rows:
+        terms[norm_text].append(_make_term(p, norm_text, text, identifier, entry_name, status))
+    return Grounder(dict(terms))
+
+
+#: All of the dashes that :func:`gilda.process.normalize` removes
+_DASHES = str.maketrans(
+    "", "", "".join([chr(0x2212), chr(0x002D), *map(chr, range(0x2010, 0x2016))])
+)
+#: ASCII whitespace, which matches Unicode's White_Space property on ASCII strings
+_ASCII_WHITESPACE = re.compile(r"[ \t\n\r\f\v]+")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+@lru_cache(maxsize=200_000)
+def _normalize(text: str) -> str:
+    """Normalize text with Gilda, memoized since many names and synonyms repeat."""
+    if _NON_ASCII.search(text) is not None:
+        return normalize(text)
+    # equivalent to gilda's normalization for ASCII strings, but in fewer passes
+    return _ASCII_WHITESPACE.sub(" ", text).translate(_DASHES).lower()
+
+
+def get_gilda_terms(
+    prefix: str,
+    identifiers_are_names: bool = False,
+    id_to_name: Optional[Mapping[str, str]] = None,
+    id_to_synonyms: Optional[Mapping[str, List[str]]] = None,
+) -> Iterable[gilda.term.Term]:
+    """Get gilda terms for the given namespace.
+
+    :param prefix: The prefix of the namespace
+    :param identifiers_are_names: Should the identifiers also be used as names?
+    :param id_to_name: A pre-loaded identifier to name mapping. If none, is loaded
+        with :func:`pyobo.get_id_name_mapping`.
+    :param id_to_synonyms: A pre-loaded identifier to synonyms mapping. If none, is
+        loaded with :func:`pyobo.get_id_synonyms_mapping`.
+    :yields: Gilda terms for the names, synonyms, and optionally identifiers
+    """
+    rows = _iter_gilda_term_tuples(
+        prefix,
+        identifiers_are_names=identifiers_are_names,
+        id_to_name=id_to_name,
+        id_to_synonyms=id_to_synonyms,
+    )
+    for row in rows:
+        yield _make_term(prefix, *row)
+
+
+def _make_term(
+    prefix: str,
+    norm_text: str,
+    text: str,
+    identifier: str,
+    entry_name: Optional[str],
+    status: str,
+) -> gilda.term.Term:
+    return gilda.term.Term(
+        norm_text=norm_text,
+        text=text,
+        db=prefix,
+        id=identifier,
+        entry_name=entry_name,
+        status=status,
+        source=prefix,
+    )
+
+
+GildaTermTuple = Tuple[str, str, str, Optional[str], str]
+
+
+def _iter_gilda_term_tuples(
+    prefix: str,
+    identifiers_are_names: bool = False,
+    id_to_name: Optional[Mapping[str, str]] = None,
+    id_to_synonyms: Optional[Mapping[str, List[str]]] = None,
+) -> Iterable[GildaTermTuple]:
+    """Iterate over normalized text, text, identifier, entry name, and status tuples."""
+    if id_to_name is None:
+        id_to_name = get_id_name_mapping(prefix)
     for identifier, name in tqdm(id_to_name.items(), desc="mapping names"):
-        yield gilda.term.Term(
-            norm_text=normalize(name),
-            text=name,
-            db=prefix,
-            id=identifier,
-            entry_name=name,
-            status="name",
-            source=prefix,
-        )
-
-    id_to_synonyms = get_id_synonyms_mapping(prefix)
+        yield _normalize(name), name, identifier, name, "name"
+
+    if id_to_synonyms is None:
+        id_to_synonyms = get_id_synonyms_mapping(prefix)
     for identifier, synonyms in tqdm(id_to_synonyms.items(), desc="mapping synonyms"):
         name = id_to_name[identifier]
         for synonym in synonyms:
-            yield gilda.term.Term(
-                norm_text=normalize(synonym),
-                text=synonym,
-                db=prefix,
-                id=identifier,
-                entry_name=name,
-                status="synonym",
-                source=prefix,
-            )
+            yield _normalize(synonym), synonym, identifier, name, "synonym"
 
     if identifiers_are_names:
         for identifier in tqdm(get_ids(prefix), desc="mapping identifiers"):
-            yield gilda.term.Term(
-                norm_text=normalize(identifier),
-                text=identifier,
-                db=prefix,
-                id=identifier,
-                entry_name=None,
-                status="identifier",
-                source=prefix,
-            )
+            yield _normalize(identifier), identifier, identifier, None, "identifier"
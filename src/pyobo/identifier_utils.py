@@ -4,7 +4,7 @@
 
 import logging
 from collections import defaultdict
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Optional, Tuple, Union
 
 import bioregistry
@@ -77,6 +77,18 @@ def normalize_prefix(prefix: str, *, curie=None, xref=None, strict: bool = True)
 BAD_CURIES = set()
 
 
+@lru_cache(maxsize=1)
+def _get_xrefs_prefix_blacklist_tuple() -> Tuple[str, ...]:
+    """Get the blacklisted xref prefixes as a tuple, which :meth:`str.startswith` checks in C."""
+    return tuple(get_xrefs_prefix_blacklist())
+
+
+@lru_cache(maxsize=1)
+def _get_xrefs_suffix_blacklist_tuple() -> Tuple[str, ...]:
+    """Get the blacklisted xref suffixes as a tuple, which :meth:`str.endswith` checks in C."""
+    return tuple(get_xrefs_suffix_blacklist())
+
+
 def normalize_curie(
     curie: str, *, strict: bool = True
 ) -> Union[Tuple[str, str], Tuple[None, None]]:
@@ -92,13 +104,11 @@ def normalize_curie(
     if curie in get_xrefs_blacklist():
         return None, None
     # Skip node if it has a blacklisted prefix
-    for blacklisted_prefix in get_xrefs_prefix_blacklist():
-        if curie.startswith(blacklisted_prefix):
-            return None, None
+    if curie.startswith(_get_xrefs_prefix_blacklist_tuple()):
+        return None, None
     # Skip node if it has a blacklisted suffix
-    for suffix in get_xrefs_suffix_blacklist():
-        if curie.endswith(suffix):
-            return None, None
+    if curie.endswith(_get_xrefs_suffix_blacklist_tuple()):
+        return None, None
 
     # Remap the curie with the full list
     curie = remap_full(curie)
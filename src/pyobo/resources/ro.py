@@ -4,6 +4,7 @@
 
 import csv
 import os
+import sys
 from functools import lru_cache
 from typing import Mapping, Tuple
 
@@ -25,8 +26,9 @@ def load_ro() -> Mapping[Tuple[str, str], str]:
     if not os.path.exists(PATH):
         download()
     with open(PATH) as file:
+        # there are only a few prefixes, so share one string for each
         return {
-            (prefix, identifier): name
+            (sys.intern(prefix), identifier): name
             for prefix, identifier, name in csv.reader(file, delimiter="\t")
         }
 
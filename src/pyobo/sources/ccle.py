@@ -2,6 +2,7 @@
 
 """Get the CCLE Cells, provided by cBioPortal."""
 
+import io
 import tarfile
 from pathlib import Path
 from typing import Iterable, Optional
@@ -10,6 +11,7 @@ import pandas as pd
 import pystow
 
 from pyobo import Obo, Reference, Term
+from pyobo.utils.iter import iterate_df_rows
 
 __all__ = [
     "get_obo",
@@ -35,11 +37,9 @@ def get_obo(*, version: Optional[str] = None, force: bool = False) -> Obo:
 def iter_terms(version: Optional[str] = None, force: bool = False) -> Iterable[Term]:
     """Iterate over CCLE Cells."""
     df = ensure_df(version=version, force=force)
-    for identifier, depmap_id, name in df.values:
-        if pd.isna(name) or pd.isnull(name):
-            name = None
+    for identifier, depmap_id, name in iterate_df_rows(df):
         term = Term.from_triple(PREFIX, identifier, name)
-        if pd.notna(depmap_id):
+        if depmap_id is not None:
             term.append_xref(Reference("depmap", depmap_id))
         yield term
 
@@ -77,19 +77,21 @@ def ensure_df(version: Optional[str] = None, force: bool = False) -> pd.DataFram
         version = get_version()
     path = ensure(version=version, force=force)
     inner_path = get_inner(version=version)
-    with tarfile.open(path) as tf:
-        return pd.read_csv(
-            tf.extractfile(inner_path),
-            sep="\t",
-            skiprows=4,  # includes skipping header
-            dtype=str,
-            usecols=[
-                0,  # Sample Identifier
-                5,  # DepMap ID
-                6,  # Name
-                # There are lots of other wonderful sample metadata in case we want more later
-            ],
-        )
+    with tarfile.open(path, mode="r:gz") as tf:
+        # read the member in one go so pandas doesn't issue many small reads on the tar stream
+        buffer = io.BytesIO(tf.extractfile(inner_path).read())
+    return pd.read_csv(
+        buffer,
+        sep="\t",
+        skiprows=4,  # includes skipping header
+        dtype=str,
+        usecols=[
+            0,  # Sample Identifier
+            5,  # DepMap ID
+            6,  # Name
+            # There are lots of other wonderful sample metadata in case we want more later
+        ],
+    )
 
 
 if __name__ == "__main__":
@@ -158,7 +158,11 @@ def get_terms(version: str) -> Iterable[Term]:
             "members",
         ]
     ]
-    it = tqdm(slim_df.values, total=len(slim_df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(
+        slim_df.itertuples(index=False, name=None),
+        total=len(slim_df.index),
+        desc=f"mapping {PREFIX}",
+    )
     unhandled_xref_type = set()
     for (
         complexportal_id,
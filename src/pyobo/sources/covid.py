@@ -27,7 +27,9 @@ def iter_terms() -> Iterable[Term]:
     """Iterate terms of COVID."""
     # ID,AUTHOR,TERM,TYPE,REFERENCE,DESCRIPTION,TAXONOMY
     df = pd.read_csv(URL)
-    for identifier, name, definition in df[["ID", "TERM", "DESCRIPTION"]].values:
+    for identifier, name, definition in df[["ID", "TERM", "DESCRIPTION"]].itertuples(
+        index=False, name=None
+    ):
         yield Term(
             reference=Reference(prefix=prefix, identifier=identifier, name=name),
             definition=definition,
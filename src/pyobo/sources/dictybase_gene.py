@@ -6,15 +6,14 @@ Note that normal dictybase idenififers are for sequences
 """
 
 import logging
-from typing import Iterable
+from typing import Iterable, Mapping, Set
 
 import click
-import pandas as pd
 from more_click import verbose_option
 from tqdm import tqdm
 
 from pyobo.struct import Obo, Reference, Synonym, Term, from_species, has_gene_product
-from pyobo.utils.io import multisetdict
+from pyobo.utils.iter import iterate_df_rows
 from pyobo.utils.path import ensure_df
 
 logger = logging.getLogger(__name__)
@@ -43,30 +42,37 @@ def get_obo(force: bool = False) -> Obo:
     )
 
 
-def get_terms(force: bool = False) -> Iterable[Term]:
-    """Get terms."""
+def get_uniprot_mappings(force: bool = False) -> Mapping[str, Set[str]]:
+    """Get a mapping from dictyBase gene identifiers to UniProt identifiers."""
     # DDB ID	DDB_G ID	Name	UniProt ID
-    uniprot_mappings = multisetdict(
-        ensure_df(PREFIX, url=URL, force=force, name="uniprot_mappings.tsv", usecols=[1, 3]).values
+    df = ensure_df(
+        PREFIX, url=UNIPROT_MAPPING, force=force, name="uniprot_mappings.tsv", usecols=[1, 3]
     )
+    df = df.dropna()
+    df = df[~df.iloc[:, 1].isin(["unknown", "pseudogene"])]
+    return df.groupby(df.columns[0])[df.columns[1]].agg(set).to_dict()
+
+
+def get_terms(force: bool = False) -> Iterable[Term]:
+    """Get terms."""
+    uniprot_mappings = get_uniprot_mappings(force=force)
 
     terms = ensure_df(PREFIX, url=URL, force=force, name="gene_info.tsv")
     # GENE ID (DDB_G ID)	Gene Name	Synonyms	Gene products
-    for identifier, name, synonyms, products in tqdm(terms.values):
+    it = tqdm(iterate_df_rows(terms), total=len(terms.index))
+    for identifier, name, synonyms, products in it:
         term = Term.from_triple(
             prefix=PREFIX,
             identifier=identifier,
             name=name,
         )
-        if products and pd.notna(products) and products != "unknown":
+        if products and products != "unknown":
             for synonym in products.split(","):
                 term.append_synonym(synonym.strip())
-        if synonyms and pd.notna(synonyms):
+        if synonyms:
             for synonym in synonyms.split(","):
                 term.append_synonym(Synonym(synonym.strip()))
-        for uniprot_id in uniprot_mappings.get(identifier, []):
-            if not uniprot_id or pd.isna(uniprot_id) or uniprot_id not in {"unknown", "pseudogene"}:
-                continue
+        for uniprot_id in sorted(uniprot_mappings.get(identifier, [])):
             term.append_relationship(has_gene_product, Reference.auto("uniprot", uniprot_id))
 
         term.set_species(identifier="44689", name="Dictyostelium discoideum")
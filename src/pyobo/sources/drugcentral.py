@@ -33,7 +33,9 @@ def get_obo(force: bool = False) -> Obo:
 def iter_terms(version: str, force: bool = False) -> Iterable[Term]:
     """Iterate over DrugCentral terms."""
     df = ensure_df(PREFIX, url=URL, version=version, force=force)
-    for smiles, inchi, inchi_key, drugcentral_id, drugcentral_name, cas in df.values:
+    for smiles, inchi, inchi_key, drugcentral_id, drugcentral_name, cas in df.itertuples(
+        index=False, name=None
+    ):
         if pd.isna(smiles) or pd.isna(inchi) or pd.isna(inchi_key):
             logger.warning("missing data for drugcentral:%s", drugcentral_id)
             continue
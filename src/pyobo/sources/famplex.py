@@ -68,7 +68,7 @@ def get_terms(version: str, force: bool = False) -> Iterable[Term]:
     hgnc_name_to_id = get_name_id_mapping("hgnc")
     in_edges = defaultdict(list)
     out_edges = defaultdict(list)
-    for h_ns, h_name, r, t_ns, t_name in relations_df.values:
+    for h_ns, h_name, r, t_ns, t_name in relations_df.itertuples(index=False, name=None):
         if h_ns == "HGNC":
             h_identifier = hgnc_name_to_id.get(h_name)
             if h_identifier is None:
@@ -100,7 +100,7 @@ def get_terms(version: str, force: bool = False) -> Iterable[Term]:
         out_edges[h].append((r, t))
         in_edges[t].append((r, h))
 
-    for (entity,) in entities_df.values:
+    for (entity,) in entities_df.itertuples(index=False, name=None):
         reference = Reference(prefix=PREFIX, identifier=entity, name=entity)
         definition, provenance = id_to_definition.get(entity, (None, None))
         term = Term(
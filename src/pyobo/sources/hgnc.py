@@ -5,12 +5,13 @@
 import json
 import logging
 from collections import Counter
-from typing import Iterable
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
 
 from tabulate import tabulate
 from tqdm import tqdm
 
-from ..api import get_name
+from ..api import get_alts_to_id, get_id_name_mapping
+from ..getters import NoBuild
 from ..struct import (
     Obo,
     Reference,
@@ -26,6 +27,16 @@ from ..struct import (
 )
 from ..utils.path import ensure_path
 
+try:
+    import ijson
+except ImportError:  # ijson is optional, but avoids loading the whole HGNC dump in memory
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, but much faster for the large HGNC dump
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 PREFIX = "hgnc"
@@ -135,6 +146,10 @@ LOCUS_TYPE_TO_SO = {
 }
 
 
+#: Prefixes of the relationship targets whose names are looked up
+NAMED_PREFIXES = ["uniprot", "ec-code", "mirbase", "rgd", "mgi"]
+
+
 def get_obo(force: bool = False) -> Obo:
     """Get HGNC as OBO."""
     return Obo(
@@ -160,13 +175,57 @@ def get_obo(force: bool = False) -> Obo:
     )
 
 
+def _get_name_getters() -> Mapping[str, Callable[[str], Optional[str]]]:
+    """Load the names and alternative identifiers for each of the named prefixes once.
+
+    Like :func:`pyobo.get_name`, alternative identifiers are mapped to their primary identifier
+    before looking up the name.
+    """
+    rv = {}
+    for prefix in NAMED_PREFIXES:
+        try:
+            names = get_id_name_mapping(prefix)
+            alts_to_id = get_alts_to_id(prefix) if names else {}
+        except NoBuild:
+            logger.warning("[%s] unable to look up names for %s", PREFIX, prefix)
+            names, alts_to_id = {}, {}
+        rv[prefix] = _get_name_getter(names, alts_to_id)
+    return rv
+
+
+def _get_name_getter(
+    names: Mapping[str, str], alts_to_id: Mapping[str, str]
+) -> Callable[[str], Optional[str]]:
+    def _get_name(identifier: str) -> Optional[str]:
+        return names.get(alts_to_id.get(identifier, identifier))
+
+    return _get_name
+
+
+def _iter_entries(path: str) -> Iterable[Dict[str, Any]]:
+    """Iterate over the entries in the HGNC complete set, streaming them if possible."""
+    if ijson is not None:
+        with open(path, "rb") as file:
+            yield from ijson.items(file, "response.docs.item")
+    elif orjson is not None:
+        with open(path, "rb") as file:
+            yield from orjson.loads(file.read())["response"]["docs"]
+    else:
+        with open(path) as file:
+            yield from json.load(file)["response"]["docs"]
+
+
 def get_terms(force: bool = False) -> Iterable[Term]:  # noqa:C901
     """Get HGNC terms."""
     unhandled_entry_keys = Counter()
     unhandle_locus_types = Counter()
     path = ensure_path(PREFIX, url=DEFINITIONS_URL, force=force)
-    with open(path) as file:
-        entries = json.load(file)["response"]["docs"]
+    entries = _iter_entries(path)
+
+    name_getters = _get_name_getters()
+    get_uniprot_name, get_ec_code_name, get_mirbase_name, get_rgd_name, get_mgi_name = (
+        name_getters[prefix] for prefix in NAMED_PREFIXES
+    )
 
     for so_id in sorted(LOCUS_TYPE_TO_SO.values()):
         if so_id:
@@ -189,10 +248,7 @@ def get_terms(force: bool = False) -> Iterable[Term]:  # noqa:C901
                 Reference(
                     prefix="uniprot",
                     identifier=uniprot_id,
-                    name=get_name(
-                        "uniprot",
-                        uniprot_id,
-                    ),
+                    name=get_uniprot_name(uniprot_id),
                 ),
             )
         for ec_code in entry.pop("enzyme_id", []):
@@ -200,7 +256,7 @@ def get_terms(force: bool = False) -> Iterable[Term]:  # noqa:C901
                 continue  # only add concrete annotations
             term.append_relationship(
                 gene_product_is_a,
-                Reference(prefix="ec-code", identifier=ec_code, name=get_name("ec-code", ec_code)),
+                Reference(prefix="ec-code", identifier=ec_code, name=get_ec_code_name(ec_code)),
             )
         for rna_central_ids in entry.pop("rna_central_id", []):
             for rna_central_id in rna_central_ids.split(","):
@@ -213,7 +269,7 @@ def get_terms(force: bool = False) -> Iterable[Term]:  # noqa:C901
             term.append_relationship(
                 transcribes_to,
                 Reference(
-                    prefix="mirbase", identifier=mirbase_id, name=get_name("mirbase", mirbase_id)
+                    prefix="mirbase", identifier=mirbase_id, name=get_mirbase_name(mirbase_id)
                 ),
             )
         snornabase_id = entry.pop("snornabase", None)
@@ -226,23 +282,24 @@ def get_terms(force: bool = False) -> Iterable[Term]:  # noqa:C901
             rgd_id = rgd_curie[len("RGD:") :]
             term.append_relationship(
                 orthologous,
-                Reference(prefix="rgd", identifier=rgd_id, name=get_name("rgd", rgd_id)),
+                Reference(prefix="rgd", identifier=rgd_id, name=get_rgd_name(rgd_id)),
             )
         for mgi_curie in entry.pop("mgd_id", []):
             mgi_id = mgi_curie[len("MGI:") :]
             term.append_relationship(
                 orthologous,
-                Reference(prefix="mgi", identifier=mgi_id, name=get_name("mgi", mgi_id)),
+                Reference(prefix="mgi", identifier=mgi_id, name=get_mgi_name(mgi_id)),
             )
 
         for xref_prefix, key in gene_xrefs:
             xref_identifiers = entry.pop(key, None)
             if xref_identifiers is None:
                 continue
-            if not isinstance(xref_identifiers, list):
-                xref_identifiers = [xref_identifiers]
-            for xref_identifier in xref_identifiers:
-                term.append_xref(Reference(prefix=xref_prefix, identifier=str(xref_identifier)))
+            if isinstance(xref_identifiers, list):
+                for xref_identifier in xref_identifiers:
+                    term.append_xref(Reference(prefix=xref_prefix, identifier=str(xref_identifier)))
+            else:
+                term.append_xref(Reference(prefix=xref_prefix, identifier=str(xref_identifiers)))
 
         for pubmed_id in entry.pop("pubmed_id", []):
             term.append_provenance(Reference(prefix="pubmed", identifier=str(pubmed_id)))
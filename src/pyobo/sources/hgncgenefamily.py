@@ -2,13 +2,13 @@
 
 """Converter for HGNC Gene Families."""
 
-from collections import defaultdict
 from typing import Iterable, List, Mapping
 
 import pandas as pd
 from tqdm import tqdm
 
 from ..struct import Obo, Reference, Synonym, SynonymTypeDef, Term, from_species
+from ..utils.iter import iterate_df_rows
 from ..utils.path import ensure_path
 
 PREFIX = "hgnc.genegroup"
@@ -38,10 +38,7 @@ def get_hierarchy(force: bool = False) -> Mapping[str, List[str]]:
     """Get the HGNC Gene Families hierarchy as a dictionary."""
     path = ensure_path(PREFIX, url=HIERARCHY_URL, force=force)
     df = pd.read_csv(path, dtype={"parent_fam_id": str, "child_fam_id": str})
-    d = defaultdict(list)
-    for parent_id, child_id in df.values:
-        d[child_id].append(parent_id)
-    return dict(d)
+    return df.groupby("child_fam_id")["parent_fam_id"].apply(list).to_dict()
 
 
 COLUMNS = ["id", "abbreviation", "name", "pubmed_ids", "desc_comment", "desc_go"]
@@ -70,22 +67,20 @@ def get_terms(force: bool = False) -> Iterable[Term]:
 def _get_terms_helper(force: bool = False) -> Iterable[Term]:
     path = ensure_path(PREFIX, url=FAMILIES_URL, force=force)
     df = pd.read_csv(path, dtype={"id": str})
-
-    it = tqdm(df[COLUMNS].values, desc=f"Mapping {PREFIX}")
+    df = df[COLUMNS]
+    it = tqdm(iterate_df_rows(df), total=len(df.index), desc=f"Mapping {PREFIX}")
     for gene_group_id, symbol, name, pubmed_ids, definition, desc_go in it:
-        if not definition or pd.isna(definition):
-            definition = None
         term = Term(
             reference=Reference(prefix=PREFIX, identifier=gene_group_id, name=name),
-            definition=definition,
+            definition=definition or None,
         )
-        if pubmed_ids and pd.notna(pubmed_ids):
+        if pubmed_ids:
             for s in pubmed_ids.split(","):
                 term.append_provenance(Reference(prefix="pubmed", identifier=s.strip()))
-        if desc_go and pd.notna(desc_go):
+        if desc_go:
             go_id = desc_go[len("http://purl.uniprot.org/go/") :]
             term.append_xref(Reference(prefix="go", identifier=go_id))
-        if symbol and pd.notna(symbol):
+        if symbol:
             term.append_synonym(Synonym(name=symbol, type=symbol_type))
         term.set_species(identifier="9606", name="Homo sapiens")
         yield term
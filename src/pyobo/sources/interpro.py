@@ -6,14 +6,20 @@ from collections import defaultdict
 from typing import Iterable, Mapping, Set, Tuple
 
 import bioversions
+import pandas as pd
 from tqdm import tqdm
 
 from .utils import get_go_mapping
 from ..struct import Obo, Reference, Term
 from ..struct.typedef import has_member
-from ..utils.io import multisetdict
 from ..utils.path import ensure_df, ensure_path
 
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:  # pyarrow is optional, but parses the large protein mapping much faster
+    pyarrow = None
+
 PREFIX = "interpro"
 
 #: Data source for protein-interpro mappings
@@ -58,12 +64,13 @@ def iter_terms(*, version: str, proteins: bool = False, force: bool = False) ->
         version=version,
     )
 
+    rows = list(entries_df.itertuples(index=False, name=None))
     references = {
         identifier: Reference(prefix=PREFIX, identifier=identifier, name=name)
-        for identifier, _, name in tqdm(entries_df.values)
+        for identifier, _, name in rows
     }
 
-    for identifier, entry_type, _ in tqdm(entries_df.values):
+    for identifier, entry_type, _ in tqdm(rows, desc=f"Mapping {PREFIX}"):
         xrefs = []
         # TODO there should be a relation here and not an xref
         for go_id, go_name in interpro_to_gos.get(identifier, []):
@@ -96,56 +103,61 @@ def get_interpro_tree(version: str, force: bool = False):
 
 
 def _parse_tree_helper(lines: Iterable[str]):
-    rv1 = defaultdict(list)
-    previous_depth, previous_id = 0, None
-    stack = [previous_id]
+    rv = defaultdict(list)
+    # pairs of (depth, identifier) for the ancestors of the current line
+    stack = []
 
     for line in tqdm(lines, desc="parsing InterPro tree"):
         depth = _count_front(line)
-        parent_id, _ = line[depth:].split("::", maxsplit=1)
-
-        if depth == 0:
-            stack.clear()
-            stack.append(parent_id)
-        else:
-            if depth > previous_depth:
-                stack.append(previous_id)
-
-            elif depth < previous_depth:
-                del stack[-1]
-
-            child_id = stack[-1]
-            rv1[child_id].append(parent_id)
+        identifier, _ = line[depth:].split("::", maxsplit=1)
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        if stack:
+            rv[identifier].append(stack[-1][1])
+        stack.append((depth, identifier))
 
-        previous_depth, previous_id = depth, parent_id
-
-    rv2 = defaultdict(list)
-    for k, vs in rv1.items():
-        for v in vs:
-            rv2[v].append(k)
-    return dict(rv2)
+    return dict(rv)
 
 
 def _count_front(s: str) -> int:
     """Count the number of leading dashes on a string."""
-    for position, element in enumerate(s):
-        if element != "-":
-            return position
+    return len(s) - len(s.lstrip("-"))
 
 
-def get_interpro_to_proteins_df(version: str, force: bool = False):
+def get_interpro_to_proteins_df(version: str, force: bool = False) -> Mapping[str, Set[str]]:
     """Get InterPro to Protein dataframe."""
     url = f"ftp://ftp.ebi.ac.uk/pub/databases/interpro/{version}/protein2ipr.dat.gz"
-    df = ensure_df(
-        PREFIX,
-        url=url,
-        compression="gzip",
-        usecols=[0, 1, 3],
-        names=INTERPRO_PROTEIN_COLUMNS,
-        version=version,
-        force=force,
+    if pyarrow is not None:
+        path = ensure_path(PREFIX, url=url, version=version, force=force)
+        df = _read_interpro_proteins_arrow(path)
+    else:
+        df = ensure_df(
+            PREFIX,
+            url=url,
+            compression="gzip",
+            usecols=[0, 1, 3],
+            names=INTERPRO_PROTEIN_COLUMNS,
+            version=version,
+            force=force,
+        )
+    return df.groupby("interpro_id")["uniprot_id"].agg(set).to_dict()
+
+
+def _read_interpro_proteins_arrow(path: str) -> pd.DataFrame:
+    """Read the UniProt and InterPro columns of the gzipped protein mapping file with pyarrow."""
+    table = pyarrow.csv.read_csv(
+        path,  # decompression is inferred from the .gz extension
+        read_options=pyarrow.csv.ReadOptions(
+            column_names=INTERPRO_PROTEIN_COLUMNS,
+            block_size=1 << 26,  # 64 MiB per parallel parse block
+        ),
+        parse_options=pyarrow.csv.ParseOptions(delimiter="\t"),
+        convert_options=pyarrow.csv.ConvertOptions(
+            include_columns=["uniprot_id", "interpro_id"],
+            column_types={"uniprot_id": pyarrow.string(), "interpro_id": pyarrow.string()},
+        ),
     )
-    return multisetdict((interpro_id, uniprot_id) for uniprot_id, interpro_id in df.values)
+    return table.to_pandas()
 
 
 if __name__ == "__main__":
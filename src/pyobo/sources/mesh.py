@@ -5,14 +5,23 @@
 import datetime
 import itertools as itt
 import logging
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
 from tqdm import tqdm
 
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional, but its compiled XPath evaluators are much faster
+    etree = None
+
 from ..struct import Obo, Reference, Synonym, Term
-from ..utils.cache import cached_json, cached_mapping
-from ..utils.io import parse_xml_gz
+from ..utils.cache import cached_mapping, cached_orjson
+from ..utils.io import iterparse_xml_gz
 from ..utils.path import ensure_path, prefix_directory_join
 
 logger = logging.getLogger(__name__)
@@ -21,6 +30,54 @@ PREFIX = "mesh"
 NOW_YEAR = str(datetime.datetime.now().year)
 
 
+@lru_cache(maxsize=None)
+def _findall(path: str) -> Callable[[Element], List[Element]]:
+    """Get a function that finds all sub-elements matching the path.
+
+    lxml elements are searched with a precompiled XPath and everything else with ``findall``.
+    """
+    if etree is None:
+        return lambda element: element.findall(path)
+    xpath = etree.XPath(path)
+
+    def _inner(element):
+        if isinstance(element, etree._Element):
+            return xpath(element)
+        return element.findall(path)
+
+    return _inner
+
+
+@lru_cache(maxsize=None)
+def _findtext(path: str) -> Callable[[Element], Optional[str]]:
+    """Get a function that finds the text of the first sub-element matching the path."""
+    findall = _findall(path)
+
+    def _inner(element):
+        elements = findall(element)
+        if not elements:
+            return None
+        return elements[0].text or ""
+
+    return _inner
+
+
+_find_tree_numbers = _findall("TreeNumberList/TreeNumber")
+_find_concepts = _findall("ConceptList/Concept")
+_find_terms = _findall("TermList/Term")
+_find_semantic_types = _findall("SemanticTypeList/SemanticType/SemanticTypeUI")
+_find_registry_numbers = _findall("RelatedRegistryNumberList/RelatedRegistryNumber")
+_find_qualifiers = _findall("AllowableQualifiersList/AllowableQualifier/QualifierReferredTo")
+_find_registry_number = _findtext("RelatedRegistryNumber")
+_find_scope_note = _findtext("ScopeNote")
+_find_concept_ui = _findtext("ConceptUI")
+_find_concept_name = _findtext("ConceptName/String")
+_find_term_ui = _findtext("TermUI")
+_find_term_name = _findtext("String")
+_find_qualifier_ui = _findtext("QualifierUI")
+_find_qualifier_name = _findtext("QualifierName/String")
+
+
 def get_obo(force: bool = False) -> Obo:
     """Get MeSH as OBO."""
     version = NOW_YEAR  # bioversions.get_version("mesh")
@@ -65,12 +122,13 @@ def get_terms(version: str, force: bool = False) -> Iterable[Term]:
         name = entry["name"]
         definition = (get_scope_note(entry) or "").strip()
 
-        synonyms = set()
+        synonym_names = {}  # used as an ordered set
         for concept in entry["concepts"]:
-            synonyms.add(concept["name"])
+            synonym_names[concept["name"]] = None
             for term in concept["terms"]:
-                synonyms.add(term["name"])
-        synonyms = [Synonym(name=synonym) for synonym in synonyms if synonym != name]
+                synonym_names[term["name"]] = None
+        synonym_names.pop(name, None)
+        synonyms = [Synonym(name=synonym_name) for synonym_name in synonym_names]
 
         mesh_id_to_term[identifier] = Term(
             definition=definition,
@@ -90,11 +148,15 @@ def get_terms(version: str, force: bool = False) -> Iterable[Term]:
 def ensure_mesh_descriptors(version: str, force: bool = False) -> List[Mapping[str, Any]]:
     """Get the parsed MeSH dictionary, and cache it if it wasn't already."""
 
-    @cached_json(path=prefix_directory_join(PREFIX, name="mesh.json", version=version), force=force)
+    @cached_orjson(
+        path=prefix_directory_join(PREFIX, name="mesh.json", version=version), force=force
+    )
     def _inner():
         path = ensure_path(PREFIX, url=get_descriptors_url(version), version=version, force=force)
-        root = parse_xml_gz(path)
-        return get_descriptor_records(root, id_key="DescriptorUI", name_key="DescriptorName/String")
+        elements = iterparse_xml_gz(path, tag="DescriptorRecord")
+        return get_descriptor_records(
+            elements, id_key="DescriptorUI", name_key="DescriptorName/String"
+        )
 
     return _inner()
 
@@ -116,25 +178,51 @@ def get_supplemental_url(version: str) -> str:
 def ensure_mesh_supplemental_records(version: str, force: bool = False) -> List[Mapping[str, Any]]:
     """Get the parsed MeSH dictionary, and cache it if it wasn't already."""
 
-    @cached_json(path=prefix_directory_join(PREFIX, name="supp.json", version=version), force=force)
+    @cached_orjson(
+        path=prefix_directory_join(PREFIX, name="supp.json", version=version), force=force
+    )
     def _inner():
         path = ensure_path(PREFIX, url=get_supplemental_url(version), version=version, force=force)
-        root = parse_xml_gz(path)
+        elements = iterparse_xml_gz(path, tag="SupplementalRecord")
         return get_descriptor_records(
-            root, id_key="SupplementalRecordUI", name_key="SupplementalRecordName/String"
+            elements, id_key="SupplementalRecordUI", name_key="SupplementalRecordName/String"
         )
 
     return _inner()
 
 
-def get_descriptor_records(element: Element, id_key: str, name_key) -> List[Mapping]:
-    """Get MeSH descriptor records."""
+def get_descriptor_records(
+    elements: Iterable[Element],
+    id_key: str,
+    name_key: str,
+    *,
+    batch_size: int = 2000,
+    max_workers: Optional[int] = None,
+) -> List[Mapping]:
+    """Get MeSH descriptor records.
+
+    :param elements: Descriptor or supplemental record elements, e.g., from
+        :func:`pyobo.utils.io.iterparse_xml_gz` or the children of a parsed root element
+    :param batch_size: The number of records sent to each worker process
+    :param max_workers: If given, the records are serialized in batches and parsed in this many
+        worker processes. By default, each record is parsed in this process as it's streamed.
+        Only use this from a script with an ``if __name__ == "__main__"`` guard.
+    """
     logger.info("extract MeSH descriptors, concepts, and terms")
 
-    rv = [
-        get_descriptor_record(descriptor, id_key=id_key, name_key=name_key)
-        for descriptor in tqdm(element, desc="Getting MeSH Descriptors")
-    ]
+    elements = tqdm(elements, desc="Getting MeSH Descriptors")
+    if max_workers is None:
+        rv = [
+            get_descriptor_record(element, id_key=id_key, name_key=name_key) for element in elements
+        ]
+    else:
+        rv = _get_descriptor_records_parallel(
+            elements,
+            id_key=id_key,
+            name_key=name_key,
+            max_workers=max_workers,
+            batch_size=batch_size,
+        )
     logger.debug(f"got {len(rv)} descriptors")
 
     # cache tree numbers
@@ -145,27 +233,74 @@ def get_descriptor_records(element: Element, id_key: str, name_key) -> List[Mapp
     }
     logger.debug(f"got {len(tree_number_to_descriptor_ui)} tree mappings")
 
+    # look up the parent of each tree number once. top-level tree numbers have no dot
+    tree_number_to_parent_descriptor_ui = {}
+    for tree_number in tree_number_to_descriptor_ui:
+        parent_tn, dot, _ = tree_number.rpartition(".")
+        if not dot:
+            continue
+        parent_descriptor_ui = tree_number_to_descriptor_ui.get(parent_tn)
+        if parent_descriptor_ui is not None:
+            tree_number_to_parent_descriptor_ui[tree_number] = parent_descriptor_ui
+        else:
+            logger.debug("missing tree number: %s", parent_tn)
+
     # add in parents to each descriptor based on their tree numbers
     for descriptor in rv:
-        parents_descriptor_uis = set()
-        for tree_number in descriptor["tree_numbers"]:
-            try:
-                parent_tn, self_tn = tree_number.rsplit(".", 1)
-            except ValueError:
-                logger.debug("No dot for %s", tree_number)
-                continue
-
-            parent_descriptor_ui = tree_number_to_descriptor_ui.get(parent_tn)
-            if parent_descriptor_ui is not None:
-                parents_descriptor_uis.add(parent_descriptor_ui)
-            else:
-                logger.debug("missing tree number: %s", parent_tn)
-
-        descriptor["parents"] = list(parents_descriptor_uis)
+        descriptor["parents"] = list(
+            {
+                tree_number_to_parent_descriptor_ui[tree_number]
+                for tree_number in descriptor["tree_numbers"]
+                if tree_number in tree_number_to_parent_descriptor_ui
+            }
+        )
 
     return rv
 
 
+def _get_descriptor_records_parallel(
+    elements: Iterable[Element], id_key: str, name_key: str, max_workers: int, batch_size: int
+) -> List[Dict[str, Any]]:
+    """Parse batches of records in worker processes, keeping a few batches in flight at once."""
+    func = partial(_get_descriptor_records_batch, id_key=id_key, name_key=name_key)
+    rv = []
+    futures = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for batch in _iter_serialized_batches(elements, batch_size=batch_size):
+            # wait on the oldest batch before submitting more, so the rest of the file
+            # isn't serialized and held in memory all at once
+            if len(futures) >= 2 * max_workers:
+                rv.extend(futures.popleft().result())
+            futures.append(executor.submit(func, batch))
+        while futures:
+            rv.extend(futures.popleft().result())
+    return rv
+
+
+def _iter_serialized_batches(elements: Iterable[Element], batch_size: int) -> Iterable[List[bytes]]:
+    """Serialize elements into batches so they can be sent to worker processes."""
+    batch = []
+    for element in elements:
+        if etree is not None and isinstance(element, etree._Element):
+            batch.append(etree.tostring(element))
+        else:
+            batch.append(ElementTree.tostring(element))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _get_descriptor_records_batch(
+    batch: List[bytes], id_key: str, name_key: str
+) -> List[Dict[str, Any]]:
+    fromstring = ElementTree.fromstring if etree is None else etree.fromstring
+    return [
+        get_descriptor_record(fromstring(data), id_key=id_key, name_key=name_key) for data in batch
+    ]
+
+
 def get_scope_note(term) -> Optional[str]:
     """Get the scope note from the preferred concept in a term's record."""
     for concept in term["concepts"]:
@@ -188,9 +323,9 @@ def get_descriptor_record(
      For supplement, set to 'SupplementalRecordName/String'
     """
     return {
-        "identifier": element.findtext(id_key),
-        "name": element.findtext(name_key),
-        "tree_numbers": sorted({x.text for x in element.findall("TreeNumberList/TreeNumber")}),
+        "identifier": _findtext(id_key)(element),
+        "name": _findtext(name_key)(element),
+        "tree_numbers": sorted(x.text for x in _find_tree_numbers(element)),
         "concepts": get_concept_records(element),
         # TODO handle AllowableQualifiersList
         # TODO add ScopeNote as description
@@ -199,28 +334,24 @@ def get_descriptor_record(
 
 def get_concept_records(element: Element) -> List[Mapping[str, Any]]:
     """Get concepts from a record."""
-    return [get_concept_record(concept) for concept in element.findall("ConceptList/Concept")]
+    return [get_concept_record(concept) for concept in _find_concepts(element)]
 
 
 def get_concept_record(concept):
     """Get a single MeSH concept record."""
-    registry_numbers = list(
-        {x.text for x in concept.findall("RelatedRegistryNumberList/RelatedRegistryNumber")}
-    )
-    registry_number = concept.findtext("RelatedRegistryNumber")
+    registry_numbers = list({x.text for x in _find_registry_numbers(concept)})
+    registry_number = _find_registry_number(concept)
     if registry_number is not None:
         registry_numbers.append(registry_number)
 
-    scope_note = concept.findtext("ScopeNote")
+    scope_note = _find_scope_note(concept)
     if scope_note is not None:
         scope_note = scope_note.replace("\\n", "\n").strip()
 
     return {
-        "concept_ui": concept.findtext("ConceptUI"),
-        "name": concept.findtext("ConceptName/String"),
-        "semantic_types": list(
-            {x.text for x in concept.findall("SemanticTypeList/SemanticType/SemanticTypeUI")}
-        ),
+        "concept_ui": _find_concept_ui(concept),
+        "name": _find_concept_name(concept),
+        "semantic_types": list({x.text for x in _find_semantic_types(concept)}),
         "related_registries": registry_numbers,
         "ScopeNote": scope_note,
         "terms": get_term_records(concept),
@@ -231,14 +362,14 @@ def get_concept_record(concept):
 
 def get_term_records(element: Element) -> List[Mapping[str, Any]]:
     """Get all of the terms for a concept."""
-    return [get_term_record(term) for term in element.findall("TermList/Term")]
+    return [get_term_record(term) for term in _find_terms(element)]
 
 
 def get_term_record(term):
     """Get a single MeSH term record."""
     return {
-        "term_ui": term.findtext("TermUI"),
-        "name": term.findtext("String"),
+        "term_ui": _find_term_ui(term),
+        "name": _find_term_name(term),
         **term.attrib,
     }
 
@@ -246,12 +377,10 @@ def get_term_record(term):
 def _get_descriptor_qualifiers(descriptor: Element) -> List[Mapping[str, str]]:
     return [
         {
-            "qualifier_ui": qualifier.findtext("QualifierUI"),
-            "name": qualifier.findtext("QualifierName/String"),
+            "qualifier_ui": _find_qualifier_ui(qualifier),
+            "name": _find_qualifier_name(qualifier),
         }
-        for qualifier in descriptor.findall(
-            "AllowableQualifiersList/AllowableQualifier/QualifierReferredTo"
-        )
+        for qualifier in _find_qualifiers(descriptor)
     ]
 
 
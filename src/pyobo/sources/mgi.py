@@ -98,7 +98,9 @@ def get_terms(force: bool = False) -> Iterable[Term]:
 
     entrez_df = get_entrez_df(force=force)
     mgi_to_entrez_id, mgi_to_synonyms = {}, {}
-    for mgi_curie, synonyms, entrez_id in entrez_df[["mgi_id", "synonyms", "entrez_id"]].values:
+    for mgi_curie, synonyms, entrez_id in entrez_df[["mgi_id", "synonyms", "entrez_id"]].itertuples(
+        index=False, name=None
+    ):
         mgi_id = mgi_curie[len("MGI:") :]
         if synonyms and pd.notna(synonyms):
             mgi_to_synonyms[mgi_id] = synonyms.split("|")
@@ -134,7 +136,9 @@ def get_terms(force: bool = False) -> Iterable[Term]:
                 mgi_to_ensemble_protein_ids[mgi_id].append(ensemble_protein_id)
 
     for mgi_curie, name, definition in tqdm(
-        df[COLUMNS].values, total=len(df.index), desc=f"Mapping {PREFIX}"
+        df[COLUMNS].itertuples(index=False, name=None),
+        total=len(df.index),
+        desc=f"Mapping {PREFIX}",
     ):
         identifier = mgi_curie[len("MGI:") :]
         term = Term(
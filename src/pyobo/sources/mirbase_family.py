@@ -35,7 +35,9 @@ def get_obo() -> Obo:
 def iter_terms(version: str) -> Iterable[Term]:
     """Get miRBase family terms."""
     df = get_df(version)
-    for family_id, name, mirna_id, mirna_name in tqdm(df.values, total=len(df.index)):
+    for family_id, name, mirna_id, mirna_name in tqdm(
+        df.itertuples(index=False, name=None), total=len(df.index)
+    ):
         term = Term(
             reference=Reference(prefix=PREFIX, identifier=family_id, name=name),
         )
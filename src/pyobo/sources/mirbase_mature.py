@@ -29,7 +29,9 @@ def get_obo() -> Obo:
 def iter_terms(version: str) -> Iterable[Term]:
     """Get miRBase mature terms."""
     df = get_mature_df(version)
-    for name, previous_name, mirbase_mature_id in tqdm(df.values, total=len(df.index)):
+    for name, previous_name, mirbase_mature_id in tqdm(
+        df.itertuples(index=False, name=None), total=len(df.index)
+    ):
         yield Term(
             reference=Reference(prefix=PREFIX, identifier=mirbase_mature_id, name=name),
             synonyms=[
@@ -153,7 +153,7 @@ def get_terms() -> Iterable[Term]:
 
     taxonomy_id_to_name = get_id_name_mapping("ncbitaxon")
 
-    it = tqdm(df.values, total=len(df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(df.itertuples(index=False, name=None), total=len(df.index), desc=f"mapping {PREFIX}")
     for tax_id, gene_id, symbol, dbxrfs, description, _gene_type in it:
         if pd.isna(symbol):
             continue
@@ -49,7 +49,7 @@ def get_df(version: str) -> pd.DataFrame:
 def iter_terms(version: str) -> Iterable[Term]:
     """Iterate NPASS terms."""
     df = get_df(version=version)
-    it = tqdm(df.values, total=len(df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(df.itertuples(index=False, name=None), total=len(df.index), desc=f"mapping {PREFIX}")
     for identifier, name, iupac, chembl_id, pubchem_compound_ids, zinc_id in it:
         xrefs = [
             Reference(prefix=xref_prefix, identifier=xref_id)
@@ -131,7 +131,11 @@ def iter_terms() -> Iterable[Term]:
     smpdb_id_to_metabolites = get_metabolite_mapping()
 
     pathways_df = ensure_df(PREFIX, url=PATHWAY_URL, sep=",")
-    it = tqdm(pathways_df.values, total=len(pathways_df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(
+        pathways_df.itertuples(index=False, name=None),
+        total=len(pathways_df.index),
+        desc=f"mapping {PREFIX}",
+    )
     for smpdb_id, pathbank_id, name, subject, _description in it:
         reference = Reference(prefix=PREFIX, identifier=pathbank_id, name=name)
         term = Term(
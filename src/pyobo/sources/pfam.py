@@ -51,7 +51,7 @@ def get_obo() -> Obo:
 def iter_terms(version: str) -> Iterable[Term]:
     """Iterate PFAM terms."""
     df = get_pfam_clan_df(version=version)
-    it = tqdm(df.values, total=len(df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(df.itertuples(index=False, name=None), total=len(df.index), desc=f"mapping {PREFIX}")
     for family_identifier, clan_id, clan_name, family_name, definition in it:
         parents = []
         if pd.notna(clan_id) and pd.notna(clan_name):
@@ -33,7 +33,7 @@ def iter_terms(version: str) -> Iterable[Term]:
     """Iterate PFAM clan terms."""
     df = get_pfam_clan_df(version=version)
     df = df[["clan_id", "clan_name"]].drop_duplicates()
-    it = tqdm(df.values, total=len(df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(df.itertuples(index=False, name=None), total=len(df.index), desc=f"mapping {PREFIX}")
     for identifier, name in it:
         yield Term(
             reference=Reference(PREFIX, identifier=identifier, name=name),
@@ -106,7 +106,7 @@ def get_remapping() -> Mapping[str, List[Tuple[str, str]]]:
     """Get a mapping from text to list of HGNC id/symbols."""
     curation_df = get_curation_df()
     rv = defaultdict(list)
-    for text, dtype, prefix, identifier in curation_df.values:
+    for text, dtype, prefix, identifier in curation_df.itertuples(index=False, name=None):
         if dtype == "protein":
             if prefix == "hgnc":
                 rv[text] = [identifier]
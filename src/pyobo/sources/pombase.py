@@ -3,8 +3,7 @@
 """Converter for PomBase."""
 
 import logging
-from collections import defaultdict
-from typing import Iterable
+from typing import Dict, Iterable, Mapping, Set
 
 import bioversions
 import click
@@ -15,6 +14,7 @@ from tqdm import tqdm
 import pyobo
 from pyobo import Reference
 from pyobo.struct import Obo, Synonym, Term, from_species, has_gene_product, orthologous
+from pyobo.utils.iter import iterate_df_rows
 from pyobo.utils.path import ensure_df
 
 logger = logging.getLogger(__name__)
@@ -54,15 +54,7 @@ POMBASE_TO_SO = {
 def get_terms(force: bool = False) -> Iterable[Term]:
     """Get terms."""
     orthologs_df = ensure_df(PREFIX, url=ORTHOLOGS_URL, force=force, header=None)
-    identifier_to_hgnc_ids = defaultdict(set)
-    hgnc_symbol_to_id = pyobo.get_name_id_mapping("hgnc")
-    for identifier, hgnc_symbols in orthologs_df.values:
-        if hgnc_symbols == "NONE":
-            continue
-        for hgnc_symbol in hgnc_symbols.split("|"):
-            hgnc_id = hgnc_symbol_to_id.get(hgnc_symbol)
-            if hgnc_id is not None:
-                identifier_to_hgnc_ids[identifier].add(hgnc_id)
+    identifier_to_hgnc_ids = _get_identifier_to_hgnc_ids(orthologs_df)
 
     df = ensure_df(PREFIX, url=URL, force=force, header=None)
     so = {
@@ -71,26 +63,54 @@ def get_terms(force: bool = False) -> Iterable[Term]:
     }
     for _, reference in sorted(so.items()):
         yield Term(reference=reference)
-    for identifier, _, symbol, chromosome, name, uniprot_id, gtype, synonyms in tqdm(df.values):
+    it = tqdm(iterate_df_rows(df), total=len(df.index))
+    # many genes share the same human orthologs, so only look each one up once
+    hgnc_references: Dict[str, Reference] = {}
+    # many genes share synonyms, so only make one for each
+    synonym_objects: Dict[str, Synonym] = {}
+    for identifier, _, symbol, chromosome, name, uniprot_id, gtype, synonyms in it:
         term = Term.from_triple(
             prefix=PREFIX,
             identifier=identifier,
-            name=symbol if pd.notna(symbol) else None,
-            definition=name if pd.notna(name) else None,
+            name=symbol,
+            definition=name,
         )
         term.append_property("chromosome", chromosome[len("chromosome_") :])
         term.append_parent(so[gtype])
         term.set_species(identifier="4896", name="Schizosaccharomyces pombe")
         for hgnc_id in identifier_to_hgnc_ids.get(identifier, []):
-            term.append_relationship(orthologous, Reference.auto("hgnc", hgnc_id))
-        if uniprot_id and pd.notna(uniprot_id):
+            hgnc_reference = hgnc_references.get(hgnc_id)
+            if hgnc_reference is None:
+                hgnc_reference = hgnc_references[hgnc_id] = Reference.auto("hgnc", hgnc_id)
+            term.append_relationship(orthologous, hgnc_reference)
+        if uniprot_id:
             term.append_relationship(has_gene_product, Reference.auto("uniprot", uniprot_id))
-        if synonyms and pd.notna(synonyms):
+        if synonyms:
             for synonym in synonyms.split(","):
-                term.append_synonym(Synonym(synonym))
+                synonym_object = synonym_objects.get(synonym)
+                if synonym_object is None:
+                    synonym_object = synonym_objects[synonym] = Synonym(name=synonym)
+                term.append_synonym(synonym_object)
         yield term
 
 
+def _get_identifier_to_hgnc_ids(orthologs_df: pd.DataFrame) -> Mapping[str, Set[str]]:
+    """Group the HGNC identifiers of the human orthologs of each PomBase gene."""
+    orthologs_df = orthologs_df[orthologs_df[1] != "NONE"]
+    if orthologs_df.empty:  # don't bother loading HGNC
+        return {}
+    orthologs_df = orthologs_df.assign(symbol=orthologs_df[1].str.split("|")).explode("symbol")
+    symbols = set(orthologs_df["symbol"])
+    hgnc_symbol_to_id = {
+        symbol: hgnc_id
+        for symbol, hgnc_id in pyobo.get_name_id_mapping("hgnc").items()
+        if symbol in symbols
+    }
+    orthologs_df["hgnc_id"] = orthologs_df["symbol"].map(hgnc_symbol_to_id)
+    orthologs_df = orthologs_df.dropna(subset=["hgnc_id"])
+    return orthologs_df.groupby(0)["hgnc_id"].agg(set).to_dict()
+
+
 @click.command()
 @verbose_option
 def _main():
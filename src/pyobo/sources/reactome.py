@@ -57,7 +57,7 @@ def iter_terms(version: str) -> Iterable[Term]:
     df["taxonomy_id"] = df["species"].map(ncbitaxon_name_to_id.get)
 
     terms = {}
-    it = tqdm(df.values, total=len(df.index), desc=f"mapping {PREFIX}")
+    it = tqdm(df.itertuples(index=False, name=None), total=len(df.index), desc=f"mapping {PREFIX}")
     for reactome_id, name, species_name, taxonomy_id in it:
         terms[reactome_id] = term = Term(
             reference=Reference(prefix=PREFIX, identifier=reactome_id, name=name),
@@ -73,21 +73,25 @@ def iter_terms(version: str) -> Iterable[Term]:
 
     pathways_hierarchy_url = f"https://reactome.org/download/{version}/ReactomePathwaysRelation.txt"
     hierarchy_df = ensure_df(PREFIX, url=pathways_hierarchy_url, header=None, version=version)
-    for parent_id, child_id in hierarchy_df.values:
+    for parent_id, child_id in hierarchy_df.itertuples(index=False, name=None):
         terms[child_id].append_parent(terms[parent_id])
 
     uniprot_pathway_url = f"https://reactome.org/download/{version}/UniProt2Reactome_All_Levels.txt"
     uniprot_pathway_df = ensure_df(
         PREFIX, url=uniprot_pathway_url, header=None, usecols=[0, 1], version=version
     )
-    for uniprot_id, reactome_id in tqdm(uniprot_pathway_df.values, total=len(uniprot_pathway_df)):
+    for uniprot_id, reactome_id in tqdm(
+        uniprot_pathway_df.itertuples(index=False, name=None), total=len(uniprot_pathway_df)
+    ):
         terms[reactome_id].append_relationship(has_part, Reference("uniprot", uniprot_id))
 
     chebi_pathway_url = f"https://reactome.org/download/{version}/ChEBI2Reactome_All_Levels.txt"
     chebi_pathway_df = ensure_df(
         PREFIX, url=chebi_pathway_url, header=None, usecols=[0, 1], version=version
     )
-    for chebi_id, reactome_id in tqdm(chebi_pathway_df.values, total=len(chebi_pathway_df)):
+    for chebi_id, reactome_id in tqdm(
+        chebi_pathway_df.itertuples(index=False, name=None), total=len(chebi_pathway_df)
+    ):
         terms[reactome_id].append_relationship(has_part, Reference("chebi", chebi_id))
 
     # ncbi_pathway_url = f'https://reactome.org/download/{version}/NCBI2Reactome_All_Levels.txt'
@@ -3,9 +3,9 @@
 """Converter for RGD."""
 
 import logging
-from typing import Iterable
+from collections import defaultdict
+from typing import Dict, Iterable
 
-import pandas as pd
 from tqdm import tqdm
 
 from ..struct import (
@@ -18,6 +18,7 @@ from ..struct import (
     has_gene_product,
     transcribes_to,
 )
+from ..utils.iter import iterate_df_rows
 from ..utils.path import ensure_df
 
 logger = logging.getLogger(__name__)
@@ -89,6 +90,35 @@ namespace_to_column = [
     ("ncbigene", "NCBI_GENE_ID"),
 ]
 
+ENSEMBL_PREFIX_LENGTH = 7
+#: Ensembl gene prefixes that are added as xrefs. The second one is reverse strand
+ENSEMBL_XREF_PREFIXES = {"ENSMUSG", "ENSRNOG"}
+#: Ensembl transcript and protein prefixes that are added as relationships
+ENSEMBL_PREFIX_TO_TYPEDEF = {
+    "ENSMUST": transcribes_to,
+    "ENSMUSP": has_gene_product,
+}
+
+#: The columns consumed by :func:`get_terms`, in the order they're unpacked
+COLUMNS = [
+    "GENE_RGD_ID",
+    "SYMBOL",
+    "NAME",
+    "GENE_DESC",
+    "OLD_NAME",
+    "OLD_SYMBOL",
+    "CURATED_REF_PUBMED_ID",
+    *(column for _, column in namespace_to_column),
+]
+
+
+def _get_synonym(synonyms: Dict[str, Synonym], name: str, synonym_type: SynonymTypeDef) -> Synonym:
+    """Get a synonym from the given dictionary, making it the first time its name is seen."""
+    synonym = synonyms.get(name)
+    if synonym is None:
+        synonym = synonyms[name] = Synonym(name=name, type=synonym_type)
+    return synonym
+
 
 def get_terms(force: bool = False) -> Iterable[Term]:
     """Get RGD terms."""
@@ -101,61 +131,76 @@ def get_terms(force: bool = False) -> Iterable[Term]:
         dtype={
             "NCBI_GENE_ID": str,
             "GENE_RGD_ID": str,
+            "ENSEMBL_ID": str,
+            "UNIPROT_ID": str,
+            "CURATED_REF_PUBMED_ID": str,
         },
         force=force,
+        use_arrow=True,
     )
-    for _, row in tqdm(df.iterrows(), total=len(df.index), desc=f"Mapping {PREFIX}"):
-        if pd.notna(row["NAME"]):
-            definition = row["NAME"]
-        elif pd.notna(row["GENE_DESC"]):
-            definition = row["GENE_DESC"]
-        else:
-            definition = None
-
-        term = Term(
-            reference=Reference(prefix=PREFIX, identifier=row["GENE_RGD_ID"], name=row["SYMBOL"]),
-            definition=definition,
-        )
-        old_names = row["OLD_NAME"]
-        if old_names and pd.notna(old_names):
+    df = df[COLUMNS]
+    it = tqdm(iterate_df_rows(df), total=len(df.index), desc=f"Mapping {PREFIX}")
+    # many genes share old names and symbols, so only make one synonym for each
+    old_name_synonyms: Dict[str, Synonym] = {}
+    old_symbol_synonyms: Dict[str, Synonym] = {}
+    for (
+        identifier,
+        symbol,
+        name,
+        description,
+        old_names,
+        old_symbols,
+        pubmed_ids,
+        *xref_columns,
+    ) in it:
+        synonyms = []
+        if old_names:
             for old_name in old_names.split(";"):
-                term.append_synonym(Synonym(name=old_name, type=old_name_type))
-        old_symbols = row["OLD_SYMBOL"]
-        if old_symbols and pd.notna(old_symbols):
+                synonyms.append(_get_synonym(old_name_synonyms, old_name, old_name_type))
+        if old_symbols:
             for old_symbol in old_symbols.split(";"):
-                term.append_synonym(Synonym(name=old_symbol, type=old_symbol_type))
-        for prefix, key in namespace_to_column:
-            xref_ids = str(row[key])
-            if xref_ids and pd.notna(xref_ids):
-                for xref_id in xref_ids.split(";"):
-                    if xref_id == "nan":
-                        continue
-                    if prefix == "uniprot":
-                        term.append_relationship(
-                            has_gene_product, Reference.auto(prefix=prefix, identifier=xref_id)
+                synonyms.append(_get_synonym(old_symbol_synonyms, old_symbol, old_symbol_type))
+
+        xrefs = []
+        relationships = defaultdict(list)
+        for (prefix, _), xref_ids in zip(namespace_to_column, xref_columns):
+            if not xref_ids:
+                continue
+            for xref_id in xref_ids.split(";"):
+                if prefix == "uniprot":
+                    relationships[has_gene_product].append(
+                        Reference.auto(prefix=prefix, identifier=xref_id)
+                    )
+                elif prefix == "ensembl":
+                    ensembl_prefix = xref_id[:ENSEMBL_PREFIX_LENGTH]
+                    if ensembl_prefix in ENSEMBL_XREF_PREFIXES:
+                        xrefs.append(Reference(prefix=prefix, identifier=xref_id))
+                    elif ensembl_prefix in ENSEMBL_PREFIX_TO_TYPEDEF:
+                        relationships[ENSEMBL_PREFIX_TO_TYPEDEF[ensembl_prefix]].append(
+                            Reference(prefix=prefix, identifier=xref_id)
                         )
-                    elif prefix == "ensembl":
-                        if xref_id.startswith("ENSMUSG") or xref_id.startswith("ENSRNOG"):
-                            # second one is reverse strand
-                            term.append_xref(Reference(prefix=prefix, identifier=xref_id))
-                        elif xref_id.startswith("ENSMUST"):
-                            term.append_relationship(
-                                transcribes_to, Reference(prefix=prefix, identifier=xref_id)
-                            )
-                        elif xref_id.startswith("ENSMUSP"):
-                            term.append_relationship(
-                                has_gene_product, Reference(prefix=prefix, identifier=xref_id)
-                            )
-                        else:
-                            logger.warning("[%s] unhandled xref ensembl:%s", PREFIX, xref_id)
                     else:
-                        term.append_xref(Reference(prefix=prefix, identifier=xref_id))
-
-        pubmed_ids = row["CURATED_REF_PUBMED_ID"]
-        if pubmed_ids and pd.notna(pubmed_ids):
-            for pubmed_id in str(pubmed_ids).split(";"):
-                term.append_provenance(Reference(prefix="pubmed", identifier=pubmed_id))
+                        logger.warning("[%s] unhandled xref ensembl:%s", PREFIX, xref_id)
+                else:
+                    xrefs.append(Reference(prefix=prefix, identifier=xref_id))
+
+        provenance = (
+            [
+                Reference(prefix="pubmed", identifier=pubmed_id)
+                for pubmed_id in pubmed_ids.split(";")
+            ]
+            if pubmed_ids
+            else []
+        )
 
+        term = Term(
+            reference=Reference(prefix=PREFIX, identifier=identifier, name=symbol),
+            definition=name or description,
+            synonyms=synonyms,
+            xrefs=xrefs,
+            relationships=relationships,
+            provenance=provenance,
+        )
         term.set_species(identifier="10116", name="Rattus norvegicus")
         yield term
 
@@ -40,7 +40,7 @@ def iter_terms(version: str) -> Iterable[Term]:
     directions = ensure_df(
         PREFIX, url="ftp://ftp.expasy.org/databases/rhea/tsv/rhea-directions.tsv", version=version
     )
-    for master, lr, rl, bi in directions.values:
+    for master, lr, rl, bi in directions.itertuples(index=False, name=None):
         terms[master] = Term(reference=Reference(PREFIX, master))
         terms[lr] = Term(reference=Reference(PREFIX, lr))
         terms[rl] = Term(reference=Reference(PREFIX, rl))
@@ -58,7 +58,7 @@ def iter_terms(version: str) -> Iterable[Term]:
         url="ftp://ftp.expasy.org/databases/rhea/tsv/rhea-relationships.tsv",
         version=version,
     )
-    for source, relation, target in hierarchy.values:
+    for source, relation, target in hierarchy.itertuples(index=False, name=None):
         if relation != "is_a":
             raise ValueError(f"RHEA unrecognized relation: {relation}")
         terms[source].append_parent(terms[target])
@@ -73,7 +73,7 @@ def iter_terms(version: str) -> Iterable[Term]:
         xref_df = ensure_df(
             PREFIX, url=f"ftp://ftp.expasy.org/databases/rhea/tsv/{url}.tsv", version=version
         )
-        for rhea_id, _, _, xref_id in xref_df.values:
+        for rhea_id, _, _, xref_id in xref_df.itertuples(index=False, name=None):
             if rhea_id not in terms:
                 logger.warning(
                     "[%s] could not find %s:%s for xref %s:%s",
@@ -31,7 +31,7 @@ def get_obo(*, force: bool = False) -> Obo:
 def iter_terms(force: Optional[bool] = False) -> Iterable[Term]:
     """Iterate over selventa chemical terms."""
     df = ensure_df(PREFIX, url=URL, skiprows=8, force=force)
-    for identifier, label, xrefs in df[["ID", "LABEL", "XREF"]].values:
+    for identifier, label, xrefs in df[["ID", "LABEL", "XREF"]].itertuples(index=False, name=None):
         term = Term.from_triple(PREFIX, identifier, label)
         for xref in xrefs.split("|") if pd.notna(xrefs) else []:
             term.append_xref(xref)
@@ -30,7 +30,9 @@ def iter_terms(force: Optional[bool] = False) -> Iterable[Term]:
     df = ensure_df(PREFIX, url=URL, skiprows=9, force=force)
 
     terms = {}
-    for identifier, label, synonyms, xref in df[["ID", "LABEL", "SYNONYMS", "XREF"]].values:
+    for identifier, label, synonyms, xref in df[["ID", "LABEL", "SYNONYMS", "XREF"]].itertuples(
+        index=False, name=None
+    ):
         term = Term.from_triple(PREFIX, identifier, label)
         for synonym in synonyms.split("|") if pd.notna(synonyms) else []:
             term.append_synonym(synonym)
@@ -39,7 +41,9 @@ def iter_terms(force: Optional[bool] = False) -> Iterable[Term]:
         terms[identifier] = term
 
     df.PARENTS = df.PARENTS.map(lambda x: x[len("SCOMP:") :], na_action="ignore")
-    for child, parent in df.loc[df.PARENTS.notna(), ["ID", "PARENTS"]].values:
+    for child, parent in df.loc[df.PARENTS.notna(), ["ID", "PARENTS"]].itertuples(
+        index=False, name=None
+    ):
         if child == parent:
             continue  # wow...
         terms[child].append_parent(terms[parent])
@@ -32,7 +32,9 @@ def iter_terms(force: Optional[bool] = False) -> Iterable[Term]:
     """Iterate over selventa disease terms."""
     df = ensure_df(PREFIX, url=URL, skiprows=9, force=force)
 
-    for identifier, label, synonyms, xrefs in df[["ID", "LABEL", "SYNONYMS", "XREF"]].values:
+    for identifier, label, synonyms, xrefs in df[["ID", "LABEL", "SYNONYMS", "XREF"]].itertuples(
+        index=False, name=None
+    ):
         term = Term.from_triple(PREFIX, identifier, label)
         for synonym in synonyms.split("|") if pd.notna(synonyms) else []:
             term.append_synonym(synonym)
@@ -30,14 +30,18 @@ def iter_terms(force: Optional[bool] = False) -> Iterable[Term]:
     df = ensure_df(PREFIX, url=URL, skiprows=9, force=force)
 
     terms = {}
-    for identifier, label, synonyms in df[["ID", "LABEL", "SYNONYMS"]].values:
+    for identifier, label, synonyms in df[["ID", "LABEL", "SYNONYMS"]].itertuples(
+        index=False, name=None
+    ):
         term = Term.from_triple(PREFIX, identifier, label)
         for synonym in synonyms.split("|") if pd.notna(synonyms) else []:
             term.append_synonym(synonym)
         terms[identifier] = term
 
     df.PARENTS = df.PARENTS.map(lambda x: x[len("SFAM:") :], na_action="ignore")
-    for child, parent in df.loc[df.PARENTS.notna(), ["ID", "PARENTS"]].values:
+    for child, parent in df.loc[df.PARENTS.notna(), ["ID", "PARENTS"]].itertuples(
+        index=False, name=None
+    ):
         if child == parent:
             continue  # wow...
         terms[child].append_parent(terms[parent])
@@ -110,7 +110,9 @@ def iter_terms(version: str, synonym_abb, autodownload: bool = False) -> Iterabl
 
                 synonyms = []
                 xrefs = []
-                for source, identifier, synonym_type, synonym in sdf.values:
+                for source, identifier, synonym_type, synonym in sdf.itertuples(
+                    index=False, name=None
+                ):
                     norm_source = normalize_prefix(source)
                     if norm_source is None or not identifier:
                         provenance = []
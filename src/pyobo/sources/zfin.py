@@ -57,7 +57,7 @@ def get_terms(force: bool = False) -> Iterable[Term]:
         PREFIX, url=ALTS_URL, name="alts.tsv", force=force, header=None, names=["alt", "zfin_id"]
     )
     primary_to_alt_ids = defaultdict(set)
-    for alt_id, zfin_id in alt_ids_df.values:
+    for alt_id, zfin_id in alt_ids_df.itertuples(index=False, name=None):
         primary_to_alt_ids[zfin_id].add(alt_id)
 
     human_orthologs = multisetdict(
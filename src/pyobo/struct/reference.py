@@ -106,6 +106,8 @@ class Reference:
 class Referenced:
     """A class that contains a reference."""
 
+    __slots__ = ()
+
     reference: Reference
 
     @property
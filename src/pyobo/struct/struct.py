@@ -448,7 +448,7 @@ class Obo:
         yield f"ontology: {self.ontology}"
 
         for typedef in self.typedefs:
-            yield from typedef.iterate_obo_lines()
+            yield from typedef.obo_lines()
 
         for term in self:
             yield from term.iterate_obo_lines()
@@ -1447,7 +1447,9 @@ def iterate_graph_typedefs(
             logger.warning("[%s] unable to parse typedef CURIE %s", graph.graph["ontology"], curie)
             continue
 
-        xrefs = [Reference.from_curie(curie, strict=strict) for curie in typedef.get("xref", [])]
+        xrefs = tuple(
+            Reference.from_curie(curie, strict=strict) for curie in typedef.get("xref", [])
+        )
         yield TypeDef(reference=reference, xrefs=xrefs)
 
 
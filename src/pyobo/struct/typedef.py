@@ -2,10 +2,24 @@
 
 """Default typedefs, references, and other structures."""
 
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from dataclasses import MISSING, Field, dataclass, fields
+from functools import lru_cache, singledispatch
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .reference import Reference, Referenced
+from .utils import add_slots
 from ..identifier_utils import normalize_curie
 from ..resources.ro import load_ro
 
@@ -38,7 +52,13 @@ __all__ = [
 ]
 
 
-@dataclass
+def _typedef_from_triple(prefix: str, identifier: str, name: Optional[str] = None) -> "TypeDef":
+    """Create a typedef from a reference."""
+    return _typedef_from_reference(Reference(prefix=prefix, identifier=identifier, name=name))
+
+
+@add_slots
+@dataclass(frozen=True)
 class TypeDef(Referenced):
     """A type definition in OBO."""
 
@@ -50,39 +70,94 @@ class TypeDef(Referenced):
     is_symmetric: Optional[bool] = None
     domain: Optional[Reference] = None
     range: Optional[Reference] = None
-    parents: List[Reference] = field(default_factory=list)
-    xrefs: List[Reference] = field(default_factory=list)
+    parents: Tuple[Reference, ...] = ()
+    xrefs: Tuple[Reference, ...] = ()
     inverse: Optional[Reference] = None
 
+    #: Hold the OBO lines, hash, and pair, which are cached on first use. Since the
+    #: typedef is frozen, these have to be set with :func:`object.__setattr__`
+    __slots__ = ("_obo_lines", "_hash", "_pair")
+
     def __hash__(self) -> int:  # noqa: D105
-        return hash((self.__class__, self.prefix, self.identifier))
+        try:
+            return self._hash
+        except AttributeError:
+            rv = hash((self.__class__, self.prefix, self.identifier))
+            object.__setattr__(self, "_hash", rv)
+            return rv
+
+    @property
+    def pair(self) -> Tuple[str, str]:
+        """The pair of namespace/identifier."""  # noqa: D401
+        try:
+            return self._pair
+        except AttributeError:
+            rv = self.reference.pair
+            object.__setattr__(self, "_pair", rv)
+            return rv
+
+    def iter_field_values(self) -> Iterable[Any]:
+        """Iterate over the values of the fields, in the same order as :data:`_FIELD_NAMES`."""
+        return map(self.__getattribute__, _FIELD_NAMES)
+
+    def __getstate__(self):  # noqa: D105
+        # leave out the caches. string hashes aren't stable between interpreters
+        return dict(zip(_FIELD_NAMES, self.iter_field_values()))
+
+    def __setstate__(self, state):  # noqa: D105
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def obo_lines(self) -> Sequence[str]:
+        """Get the lines to write in an OBO file.
+
+        The lines are only generated the first time, which is safe since typedefs are frozen.
+        """
+        try:
+            return self._obo_lines
+        except AttributeError:
+            rv = tuple(self._get_obo_lines())
+            object.__setattr__(self, "_obo_lines", rv)
+            return rv
 
     def iterate_obo_lines(self) -> Iterable[str]:
         """Iterate over the lines to write in an OBO file."""
-        yield "\n[Typedef]"
-        yield f"id: {self.reference.curie}"
+        return iter(self.obo_lines())
+
+    def write_obo_lines(self, write: Callable[[str], Any]) -> None:
+        """Write the lines for an OBO file, each followed by a newline.
+
+        :param write: A function that writes a string, like the ``write`` method of a file
+        """
+        write("\n".join(self.obo_lines()))
+        write("\n")
+
+    def _get_obo_lines(self) -> List[str]:
+        lines = ["\n[Typedef]", f"id: {self.reference.curie}"]
+        append = lines.append
         if self.name:
-            yield f"name: {self.reference.name}"
+            append(f"name: {self.reference.name}")
 
         if self.namespace:
-            yield f"namespace: {self.namespace}"
+            append(f"namespace: {self.namespace}")
 
         if self.comment:
-            yield f"comment: {self.comment}"
+            append(f"comment: {self.comment}")
 
-        for xref in self.xrefs:
-            yield f"xref: {xref}"
+        if self.xrefs:
+            lines.extend(map("xref: {}".format, self.xrefs))
 
         if self.is_transitive is not None:
-            yield f'is_transitive: {"true" if self.is_transitive else "false"}'
+            append(f'is_transitive: {"true" if self.is_transitive else "false"}')
 
         if self.is_symmetric is not None:
-            yield f'is_symmetric: {"true" if self.is_symmetric else "false"}'
+            append(f'is_symmetric: {"true" if self.is_symmetric else "false"}')
 
-    @classmethod
-    def from_triple(cls, prefix: str, identifier: str, name: Optional[str] = None) -> "TypeDef":
-        """Create a typedef from a reference."""
-        return cls(reference=Reference(prefix=prefix, identifier=identifier, name=name))
+        return lines
+
+    #: Create a typedef from a reference. TypeDef isn't subclassed, so this doesn't need to
+    #: be bound to the class like a classmethod
+    from_triple = staticmethod(_typedef_from_triple)
 
     @classmethod
     def from_curie(cls, curie: str, name: Optional[str] = None) -> "TypeDef":
@@ -91,22 +166,81 @@ class TypeDef(Referenced):
         return cls.from_triple(prefix=prefix, identifier=identifier, name=name)
 
 
+#: The names of the fields of :class:`TypeDef`, so serializers don't need to call
+#: :func:`dataclasses.fields` for each typedef
+_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(TypeDef))
+
+
+def _get_default_factory(f: Field) -> Callable[[], Any]:
+    """Get a function that makes the default value for a field."""
+    if f.default_factory is not MISSING:  # type: ignore
+        return f.default_factory  # type: ignore
+    if f.default is not MISSING:
+        default = f.default
+        return lambda: default
+    raise TypeError(f"TypeDef.{f.name} needs a default to make a typedef from a reference")
+
+
+_set_reference = TypeDef.reference.__set__
+#: The slot setters of all other fields, paired with the functions that make their defaults
+_DEFAULT_FIELD_SETTERS: Tuple[
+    Tuple[Callable[[TypeDef, Any], None], Callable[[], Any]], ...
+] = tuple(
+    (getattr(TypeDef, f.name).__set__, _get_default_factory(f))
+    for f in fields(TypeDef)
+    if f.name != "reference"
+)
+
+
+def _typedef_from_reference(reference: Reference) -> TypeDef:
+    """Create a typedef that only has a reference, without going through ``__init__``.
+
+    The ``__init__`` of a frozen dataclass sets each field with :func:`object.__setattr__`,
+    so it's about twice as fast to set the slots directly. This is used for the Relation
+    Ontology typedefs, where there are hundreds of them.
+    """
+    rv = object.__new__(TypeDef)
+    _set_reference(rv, reference)
+    for set_field, default_factory in _DEFAULT_FIELD_SETTERS:
+        set_field(rv, default_factory())
+    return rv
+
+
 RelationHint = Union[Reference, TypeDef, Tuple[str, str], str]
 
 
+@lru_cache(maxsize=4096)
+def _normalize_curie_cached(curie: str) -> Union[Tuple[str, str], Tuple[None, None]]:
+    """Normalize a CURIE, remembering the result since the same relations are looked up often."""
+    return normalize_curie(curie)
+
+
+@singledispatch
 def get_reference_tuple(relation: RelationHint) -> Tuple[str, str]:
-    """Get tuple for typedef/reference."""
-    if isinstance(relation, (Reference, TypeDef)):
-        return relation.prefix, relation.identifier
-    elif isinstance(relation, tuple):
-        return relation
-    elif isinstance(relation, str):
-        prefix, identifier = normalize_curie(relation)
-        if prefix is None:
-            raise ValueError(f"string given is not valid curie: {relation}")
-        return prefix, identifier
-    else:
-        raise TypeError(f"Relation is invalid type: {relation}")
+    """Get tuple for typedef/reference.
+
+    Other relation types can be supported with ``get_reference_tuple.register``.
+    """
+    raise TypeError(f"Relation is invalid type: {relation}")
+
+
+@get_reference_tuple.register(Reference)
+@get_reference_tuple.register(TypeDef)
+def _get_referenced_tuple(relation: Union[Reference, TypeDef]) -> Tuple[str, str]:
+    return relation.prefix, relation.identifier
+
+
+@get_reference_tuple.register(tuple)
+def _get_tuple(relation: Tuple[str, str]) -> Tuple[str, str]:
+    return relation
+
+
+@get_reference_tuple.register(str)
+def _get_curie_tuple(relation: str) -> Tuple[str, str]:
+    prefix, identifier = _normalize_curie_cached(relation)
+    if prefix is None:
+        raise ValueError(f"string given is not valid curie: {relation}")
+    return prefix, identifier
 
 
 RO_PREFIX = "RO"
@@ -124,15 +258,17 @@ species_specific = TypeDef(
     "species with RO:0002162 (in taxon)",
 )
 
+_part_of_reference = Reference(prefix=BFO_PREFIX, identifier="0000050", name="part of")
+_has_part_reference = Reference(prefix=BFO_PREFIX, identifier="0000051", name="has part")
 part_of = TypeDef(
-    reference=Reference(prefix=BFO_PREFIX, identifier="0000050", name="part of"),
+    reference=_part_of_reference,
     comment="Inverse of has_part",
-    inverse=Reference(prefix=BFO_PREFIX, identifier="0000051", name="has part"),
+    inverse=_has_part_reference,
 )
 has_part = TypeDef(
-    reference=Reference(prefix=BFO_PREFIX, identifier="0000051", name="has part"),
+    reference=_has_part_reference,
     comment="Inverse of part_of",
-    inverse=Reference(prefix=BFO_PREFIX, identifier="0000050", name="part of"),
+    inverse=_part_of_reference,
 )
 is_a = TypeDef(
     reference=Reference(prefix="rdfs", identifier="subClassOf", name="subclass of"),
@@ -158,21 +294,22 @@ orthologous = TypeDef(
     is_symmetric=True,
 )
 
+_role_of_reference = Reference(prefix=RO_PREFIX, identifier="0000081", name="role of")
 has_role = TypeDef(
     reference=Reference(prefix=RO_PREFIX, identifier="0000087", name="has role"),
     definition="a relation between an independent continuant (the bearer) and a role,"
     " in which the role specifically depends on the bearer for its existence",
     domain=Reference(prefix=BFO_PREFIX, identifier="0000004", name="independent continuant"),
     range=Reference(prefix=BFO_PREFIX, identifier="0000023", name="role"),
-    parents=[Reference(prefix=RO_PREFIX, identifier="0000053", name="bearer of")],
-    inverse=Reference(prefix=RO_PREFIX, identifier="0000081", name="role of"),
+    parents=(Reference(prefix=RO_PREFIX, identifier="0000053", name="bearer of"),),
+    inverse=_role_of_reference,
 )
 
 role_of = TypeDef(
-    reference=Reference(prefix=RO_PREFIX, identifier="0000081", name="role of"),
+    reference=_role_of_reference,
     definition="a relation between a role and an independent continuant (the bearer),"
     " in which the role specifically depends on the bearer for its existence",
-    parents=[Reference(prefix=RO_PREFIX, identifier="0000052", name="inheres in")],
+    parents=(Reference(prefix=RO_PREFIX, identifier="0000052", name="inheres in"),),
     inverse=has_role.reference,
 )
 
@@ -237,10 +374,62 @@ has_functional_parent = TypeDef(
     ),
 )
 
-default_typedefs: Dict[Tuple[str, str], TypeDef] = {
-    v.pair: v for k, v in locals().items() if isinstance(v, TypeDef)
-}
+_DEFAULT_TYPEDEFS: Tuple[TypeDef, ...] = (
+    from_species,
+    species_specific,
+    part_of,
+    has_part,
+    is_a,
+    has_member,
+    member_of,
+    superclass_of,
+    develops_from,
+    orthologous,
+    has_role,
+    role_of,
+    has_mature,
+    transcribes_to,
+    translates_to,
+    gene_product_of,
+    has_gene_product,
+    gene_product_is_a,
+    is_immediately_transformed_from,
+    is_conjugate_base_of,
+    is_conjugate_acid_of,
+    is_enantiomer_of,
+    is_tautomer_of,
+    has_parent_hydride,
+    is_substituent_group_from,
+    has_functional_parent,
+)
+
+
+@lru_cache(maxsize=1)
+def _get_default_typedefs() -> Dict[Tuple[str, str], TypeDef]:
+    """Get the default typedefs, extended with the names from the Relation Ontology."""
+    rv = {typedef.pair: typedef for typedef in _DEFAULT_TYPEDEFS}
+    ro = load_ro()
+    # keep the order of the relation ontology file, after the explicit typedefs
+    for (prefix, identifier), name in ro.items():
+        if (prefix, identifier) not in rv:
+            rv[prefix, identifier] = _typedef_from_triple(prefix, identifier, name)
+    return rv
+
+
+class _DefaultTypedefs(Mapping[Tuple[str, str], TypeDef]):
+    """A mapping of the default typedefs that loads the Relation Ontology on first use."""
+
+    def __getitem__(self, pair: Tuple[str, str]) -> TypeDef:  # noqa: D105
+        return _get_default_typedefs()[pair]
+
+    def __contains__(self, pair) -> bool:  # noqa: D105
+        return pair in _get_default_typedefs()
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:  # noqa: D105
+        return iter(_get_default_typedefs())
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(_get_default_typedefs())
+
 
-for pair, name in load_ro().items():
-    if pair not in default_typedefs:
-        default_typedefs[pair] = TypeDef.from_triple(pair[0], pair[1], name)
+default_typedefs: Mapping[Tuple[str, str], TypeDef] = _DefaultTypedefs()
@@ -2,6 +2,8 @@
 
 """Utilities for data structures for OBO."""
 
+import dataclasses
+
 OBO_ESCAPE = {c: f"\\{c}" for c in ':,"\\()[]{}'}
 OBO_ESCAPE[" "] = "\\W"
 
@@ -14,3 +16,44 @@ def obo_escape(string: str) -> str:
 def comma_separate(elements) -> str:
     """Map a list to strings and make comma separated."""
     return ", ".join(map(str, elements))
+
+
+def add_slots(cls):
+    """Rebuild a dataclass with ``__slots__`` for its fields.
+
+    This does the same as ``dataclass(slots=True)``, which is only available in Python 3.10+.
+    It has to be applied on top of the :func:`dataclasses.dataclass` decorator. Any ``__slots__``
+    declared in the class body are kept as additional slots, e.g., for caches that aren't fields.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    slots = field_names + tuple(cls.__dict__.get("__slots__", ()))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = slots
+    for name in slots:
+        # remove the class attributes holding the defaults, which conflict with the slots.
+        # the defaults are already baked into the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    rv = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    rv.__qualname__ = cls.__qualname__
+    if cls.__dataclass_params__.frozen:
+        # the generated methods refer to the original class, so they have to be remade
+        rv.__setattr__, rv.__delattr__ = _get_frozen_methods(rv, field_names)
+    return rv
+
+
+def _get_frozen_methods(cls, field_names):
+    """Get the ``__setattr__`` and ``__delattr__`` that a frozen dataclass generates."""
+
+    def __setattr__(self, name, value):  # noqa: N807
+        if type(self) is cls or name in field_names:
+            raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+        super(cls, self).__setattr__(name, value)
+
+    def __delattr__(self, name):  # noqa: N807
+        if type(self) is cls or name in field_names:
+            raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+        super(cls, self).__delattr__(name)
+
+    return __setattr__, __delattr__
@@ -14,6 +14,11 @@ from typing import Any, Callable, Collection, Dict, Iterable, List, Mapping, Typ
 import networkx as nx
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, but much faster for large JSON caches
+    orjson = None
+
 from .io import open_map_tsv, open_multimap_tsv, write_map_tsv, write_multimap_tsv
 
 logger = logging.getLogger(__name__)
@@ -85,6 +90,34 @@ def cached_json(
     return wrapped
 
 
+def cached_orjson(
+    path: Union[str, Path], force: bool = False
+) -> Callable[[JSONGetter], JSONGetter]:  # noqa: D202
+    """Create a decorator to apply to a JSON getter that uses :mod:`orjson` when it's available.
+
+    The cache is a regular JSON file, so it can be shared with :func:`cached_json`.
+    """
+    if orjson is None:
+        return cached_json(path=path, force=force)
+
+    def wrapped(f: JSONGetter) -> JSONGetter:  # noqa: D202
+        """Wrap a mapping getter so it can be auto-loaded from a cache."""
+
+        @functools.wraps(f)
+        def _wrapped() -> JSONType:
+            if os.path.exists(path) and not force:
+                with open(path, "rb") as file:
+                    return orjson.loads(file.read())
+            rv = f()
+            with open(path, "wb") as file:
+                file.write(orjson.dumps(rv, option=orjson.OPT_INDENT_2))
+            return rv
+
+        return _wrapped
+
+    return wrapped
+
+
 def cached_pickle(path: Union[str, Path], force: bool = False):
     """Create a decorator to apply to a pickle getter."""
 
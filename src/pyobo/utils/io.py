@@ -5,16 +5,20 @@
 import csv
 import gzip
 import logging
-import time
 from collections import defaultdict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional, Set, Tuple, TypeVar, Union
+from typing import Iterable, Iterator, List, Mapping, Optional, Set, Tuple, TypeVar, Union
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
 from tqdm import tqdm
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional, but streams large XML dumps much faster
+    lxml_etree = None
+
 __all__ = [
     "open_map_tsv",
     "open_multimap_tsv",
@@ -23,7 +27,7 @@ __all__ = [
     "write_map_tsv",
     "write_multimap_tsv",
     "write_iterable_tsv",
-    "parse_xml_gz",
+    "iterparse_xml_gz",
     "get_writer",
     "open_reader",
     "get_reader",
@@ -153,11 +157,24 @@ def write_iterable_tsv(
         writer.writerows(it)
 
 
-def parse_xml_gz(path: Union[str, Path]) -> Element:
-    """Parse an XML file from a path to a GZIP file."""
-    t = time.time()
-    logger.info("parsing xml from %s", path)
+def iterparse_xml_gz(path: Union[str, Path], tag: str) -> Iterator[Element]:
+    """Iterate over the elements with the given tag in a GZIP XML file without loading it all.
+
+    Each element is cleared after it has been yielded, so it should be consumed before the
+    iterator is advanced.
+    """
+    logger.info("iterating over %s elements in xml from %s", tag, path)
     with gzip.open(path) as file:
-        tree = ElementTree.parse(file)
-    logger.info("parsed xml in %.2f seconds", time.time() - t)
-    return tree.getroot()
+        if lxml_etree is not None:
+            for _, element in lxml_etree.iterparse(file, events=("end",), tag=tag, huge_tree=True):
+                yield element
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        else:
+            context = ElementTree.iterparse(file, events=("start", "end"))
+            _, root = next(context)
+            for event, element in context:
+                if event == "end" and element.tag == tag:
+                    yield element
+                    root.clear()
@@ -6,11 +6,13 @@ import csv
 import gzip
 from typing import Iterable, List, Tuple, TypeVar
 
+import pandas as pd
 from more_itertools import peekable
 
 __all__ = [
     "iterate_together",
     "iterate_gzips_together",
+    "iterate_df_rows",
 ]
 
 X = TypeVar("X")
@@ -18,6 +20,12 @@ Z = TypeVar("Z")
 Y = TypeVar("Y")
 
 
+def iterate_df_rows(df: pd.DataFrame) -> Iterable[Tuple]:
+    """Iterate over the rows of a dataframe as tuples, using None for missing values."""
+    df = df.astype(object)
+    return df.where(df.notna(), None).itertuples(index=False, name=None)
+
+
 def iterate_gzips_together(a_path, b_path) -> Iterable[Tuple[str, str, List[str]]]:
     """Iterate over two gzipped files together."""
     with gzip.open(a_path, mode="rt", errors="ignore") as a, gzip.open(b_path, mode="rt") as b:
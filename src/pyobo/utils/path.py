@@ -2,6 +2,7 @@
 
 """Utilities for building paths."""
 
+import gzip
 import logging
 import os
 import shutil
@@ -15,6 +16,12 @@ from pystow.utils import name_from_url, read_tarfile_csv
 
 from pyobo.constants import RAW_MODULE
 
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:  # pyarrow is optional, but parses large tables much faster
+    pyarrow = None
+
 __all__ = [
     "prefix_directory_join",
     "prefix_directory_join",
@@ -119,13 +126,47 @@ def ensure_df(
     force: bool = False,
     sep: str = "\t",
     dtype=str,
+    use_arrow: bool = False,
     **kwargs,
 ) -> pd.DataFrame:
-    """Download a file and open as a dataframe."""
+    """Download a file and open as a dataframe.
+
+    :param use_arrow: Parse the file with :mod:`pyarrow` if it's installed. This reads every
+        column as a string, takes the header from the first line, and only supports comments
+        at the top of the file. If any other keyword arguments are given, :func:`pandas.read_csv`
+        is used instead.
+    """
     _path = ensure_path(prefix, *parts, url=url, version=version, name=name, force=force)
+    if use_arrow and pyarrow is not None and set(kwargs) <= {"header", "comment"}:
+        if kwargs.get("header", 0) == 0:
+            return _read_arrow_df(_path, sep=sep, comment=kwargs.get("comment"))
     return pd.read_csv(_path, sep=sep, dtype=dtype, **kwargs)
 
 
+def _read_arrow_df(path: Union[str, Path], sep: str, comment: Optional[str] = None) -> pd.DataFrame:
+    """Read a table with a header in which all columns are strings with :mod:`pyarrow`."""
+    path = Path(path)
+    skip_rows = 0
+    with (gzip.open(path, "rt") if path.suffix == ".gz" else open(path)) as file:
+        for line in file:
+            if comment is None or not line.startswith(comment):
+                break
+            skip_rows += 1
+        else:  # same as pandas when there's no header
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+    columns = line.rstrip("\r\n").split(sep)
+    table = pyarrow.csv.read_csv(
+        path.as_posix(),  # decompression is inferred from the extension
+        read_options=pyarrow.csv.ReadOptions(skip_rows=skip_rows),
+        parse_options=pyarrow.csv.ParseOptions(delimiter=sep),
+        convert_options=pyarrow.csv.ConvertOptions(
+            column_types={column: pyarrow.string() for column in columns},
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas()
+
+
 def ensure_tar_df(
     prefix: str,
     *parts: str,
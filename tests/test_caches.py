@@ -2,12 +2,13 @@
 
 """Tests for PyOBO caches."""
 
+import json
 import os
 import time
 import unittest
 from tempfile import TemporaryDirectory
 
-from pyobo.utils.cache import cached_mapping, cached_multidict
+from pyobo.utils.cache import cached_mapping, cached_multidict, cached_orjson
 from pyobo.utils.io import open_map_tsv, open_multimap_tsv
 
 sleep_time = 3
@@ -86,3 +87,25 @@ class TestCaches(unittest.TestCase):
         self.assertIsNotNone(d)
         self.assertEqual(3, len(d))
         self.assertEqual(dict(a=["a1", "a2"], b=["b1"], c=["c1", "c2"]), d)
+
+    def test_orjson(self):
+        """Test caching JSON with orjson."""
+        expected = [{"identifier": "a", "tree_numbers": ["A01", "A01.001"]}]
+        calls = []
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.json")
+
+            @cached_orjson(path=path)
+            def _get_json():
+                calls.append(1)
+                return expected
+
+            self.assertEqual(expected, _get_json())
+
+            """Test cache"""
+            with open(path) as file:
+                self.assertEqual(expected, json.load(file))
+
+            """Test reload"""
+            self.assertEqual(expected, _get_json())
+            self.assertEqual(1, len(calls))
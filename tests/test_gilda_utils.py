@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for PyOBO's Gilda utilities."""
+
+import random
+import string
+import unittest
+from unittest import mock
+
+try:
+    from gilda.process import normalize
+
+    from pyobo.gilda_utils import _normalize, get_grounder
+except ImportError:  # gilda is optional
+    normalize = None
+
+#: Normalized text, text, identifier, entry name, and status tuples for each prefix
+TERM_TUPLES = {
+    "b": [
+        ("foo", "foo", "2", "foo", "name"),
+        ("foo", "Foo", "1", "foo", "synonym"),
+        ("foo", "foo", "2", "foo", "synonym"),
+    ],
+    "a": [
+        ("foo", "foo", "3", "foo", "name"),
+        ("bar", "bar", "1", "bar", "name"),
+    ],
+}
+
+#: Letters, digits, dashes, whitespace, separators, and punctuation to build random strings from
+CHARACTERS = (
+    string.ascii_letters
+    + string.digits
+    + "-‐‑‒–—―−"
+    + " \t\n\r\f\v\x1c\x1d\x1e\x1f\x85\xa0_.,;:'\"()"
+)
+
+
+@unittest.skipIf(normalize is None, "gilda is not installed")
+class TestNormalize(unittest.TestCase):
+    """Test the memoized normalization matches gilda's."""
+
+    def assert_normalize(self, text: str):
+        """Assert the text is normalized the same as gilda."""
+        self.assertEqual(normalize(text), _normalize(text), msg=repr(text))
+
+    def test_edge_cases(self):
+        """Test ASCII edge cases for dashes and whitespace."""
+        for text in [
+            "",
+            "Foo-Bar",
+            "foo--bar",
+            "-leading and trailing-",
+            "Foo \t\n\r\f\v Bar",
+            "  runs   of   spaces  ",
+            "\v",
+            "vertical\vtab",
+            # gilda's regex doesn't count the separators as whitespace, but str.split does
+            "file\x1cgroup\x1drecord\x1eunit\x1f",
+            " \x1c ",
+            # not ASCII, so these go through gilda
+            "en–dash em—dash minus−sign",
+            "no\xa0break\x85next",
+            "ÄBC ΑΒΓ",
+        ]:
+            with self.subTest(text=text):
+                self.assert_normalize(text)
+
+    def test_random(self):
+        """Test random strings built from the edge case characters."""
+        rng = random.Random(0)  # noqa: S311
+        for _ in range(2000):
+            text = "".join(rng.choice(CHARACTERS) for _ in range(rng.randint(0, 20)))
+            self.assert_normalize(text)
+
+
+@unittest.skipIf(normalize is None, "gilda is not installed")
+class TestGrounder(unittest.TestCase):
+    """Test building a grounder."""
+
+    @mock.patch("pyobo.gilda_utils.Grounder")
+    @mock.patch(
+        "pyobo.gilda_utils._iter_gilda_term_tuples",
+        side_effect=lambda prefix, **_: TERM_TUPLES[prefix],
+    )
+    def test_get_grounder(self, _, mock_grounder):
+        """Test terms are deduplicated and sorted by text, prefix, and identifier."""
+        get_grounder(["b", "a"])
+        # the grounder loads its disambiguation models from the web, so only check its terms
+        terms = mock_grounder.call_args[0][0]
+        self.assertEqual({"foo", "bar"}, set(terms))
+        self.assertEqual(
+            [("Foo", "b", "1", "synonym"), ("foo", "a", "3", "name"), ("foo", "b", "2", "name")],
+            [(term.text, term.db, term.id, term.status) for term in terms["foo"]],
+        )
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for dictyBase Gene."""
+
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from pyobo.sources.dictybase_gene import UNIPROT_MAPPING, get_uniprot_mappings
+
+#: The DDB_G ID and UniProt ID columns, as read by :func:`pyobo.utils.path.ensure_df`
+UNIPROT_DF = pd.DataFrame(
+    [
+        ["DDB_G0000001", "Q00001"],
+        ["DDB_G0000001", "Q00002"],
+        ["DDB_G0000001", "Q00001"],
+        ["DDB_G0000002", "Q00003"],
+        ["DDB_G0000003", "unknown"],
+        ["DDB_G0000004", "pseudogene"],
+        ["DDB_G0000005", float("nan")],
+        [float("nan"), "Q00004"],
+    ],
+    columns=["DDB_G ID", "UniProt ID"],
+)
+
+
+class TestDictybaseGene(unittest.TestCase):
+    """Tests for dictyBase Gene."""
+
+    @mock.patch("pyobo.sources.dictybase_gene.ensure_df", return_value=UNIPROT_DF)
+    def test_uniprot_mappings(self, mock_ensure_df):
+        """Test missing, unknown, and pseudogene rows are dropped and the rest are grouped."""
+        self.assertEqual(
+            {
+                "DDB_G0000001": {"Q00001", "Q00002"},
+                "DDB_G0000002": {"Q00003"},
+            },
+            get_uniprot_mappings(),
+        )
+        self.assertEqual(UNIPROT_MAPPING, mock_ensure_df.call_args[1]["url"])
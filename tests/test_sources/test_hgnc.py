@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for HGNC."""
+
+import unittest
+from unittest import mock
+
+from pyobo.getters import NoBuild
+from pyobo.sources.hgnc import _get_name_getters
+
+NAMES = {
+    "uniprot": {"P12345": "Protein A", "Q99999": "Protein B"},
+    "mgi": {"1": "Gene 1"},
+}
+ALTS_TO_ID = {
+    "uniprot": {"A0A000": "P12345", "Q99999": "P00000"},
+}
+
+
+def _get_id_name_mapping(prefix):
+    if prefix == "rgd":
+        raise NoBuild(prefix)
+    return NAMES.get(prefix, {})
+
+
+def _get_alts_to_id(prefix):
+    return ALTS_TO_ID.get(prefix, {})
+
+
+class TestHGNC(unittest.TestCase):
+    """Tests for HGNC."""
+
+    @mock.patch("pyobo.sources.hgnc.get_alts_to_id", side_effect=_get_alts_to_id)
+    @mock.patch("pyobo.sources.hgnc.get_id_name_mapping", side_effect=_get_id_name_mapping)
+    def test_name_getters(self, _, mock_get_alts_to_id):
+        """Test names are looked up by primary identifier, like :func:`pyobo.get_name`."""
+        name_getters = _get_name_getters()
+        self.assertEqual("Protein A", name_getters["uniprot"]("P12345"))
+        self.assertEqual("Protein A", name_getters["uniprot"]("A0A000"))
+        # the alternative identifier takes priority, and its primary identifier has no name
+        self.assertIsNone(name_getters["uniprot"]("Q99999"))
+        self.assertIsNone(name_getters["uniprot"]("nope"))
+        self.assertEqual("Gene 1", name_getters["mgi"]("1"))
+        self.assertIsNone(name_getters["rgd"]("1"))
+        self.assertIsNone(name_getters["ec-code"]("1.1.1.1"))
+        # alts are only loaded for prefixes that have names
+        self.assertEqual(
+            {"uniprot", "mgi"}, {args[0] for args, _ in mock_get_alts_to_id.call_args_list}
+        )
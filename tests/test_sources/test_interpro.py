@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for InterPro."""
+
+import unittest
+
+from pyobo.sources.interpro import _count_front, _parse_tree_helper
+
+TREE = """\
+IPR000001::Kringle::
+--IPR000002::Kringle child A::
+----IPR000003::Kringle grandchild::
+--IPR000004::Kringle child B::
+----IPR000007::Kringle grandchild B::
+------IPR000008::Kringle great-grandchild::
+--IPR000009::Kringle child C::
+IPR000005::Cdc20/Fizzy::
+--IPR000006::Cdc20 child::
+"""
+
+
+class TestInterPro(unittest.TestCase):
+    """Tests for InterPro."""
+
+    def test_count_front(self):
+        """Test counting leading dashes."""
+        self.assertEqual(0, _count_front("IPR000001::Kringle::"))
+        self.assertEqual(2, _count_front("--IPR000002::Kringle child A::"))
+        self.assertEqual(4, _count_front("----IPR000003::Kringle grandchild::"))
+
+    def test_parse_tree(self):
+        """Test parsing the parent/child tree file."""
+        rv = _parse_tree_helper(TREE.splitlines())
+        self.assertEqual(
+            {
+                "IPR000002": ["IPR000001"],
+                "IPR000003": ["IPR000002"],
+                "IPR000004": ["IPR000001"],
+                "IPR000007": ["IPR000004"],
+                "IPR000008": ["IPR000007"],
+                "IPR000009": ["IPR000001"],
+                "IPR000006": ["IPR000005"],
+            },
+            rv,
+        )
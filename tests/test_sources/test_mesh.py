@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for MeSH."""
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from xml.etree import ElementTree
+
+from pyobo.sources.mesh import get_descriptor_records
+from pyobo.utils import io
+from pyobo.utils.io import iterparse_xml_gz
+
+DESCRIPTORS = """\
+<?xml version="1.0"?>
+<DescriptorRecordSet LanguageCode="eng">
+  <DescriptorRecord DescriptorClass="1">
+    <DescriptorUI>D000001</DescriptorUI>
+    <DescriptorName><String>Parent</String></DescriptorName>
+    <TreeNumberList>
+      <TreeNumber>A01</TreeNumber>
+    </TreeNumberList>
+    <ConceptList>
+      <Concept PreferredConceptYN="Y">
+        <ConceptUI>M000001</ConceptUI>
+        <ConceptName><String>Parent</String></ConceptName>
+        <ScopeNote>A parent.\\n</ScopeNote>
+        <TermList>
+          <Term ConceptPreferredTermYN="Y">
+            <TermUI>T000001</TermUI>
+            <String>Parent</String>
+          </Term>
+          <Term ConceptPreferredTermYN="N">
+            <TermUI>T000002</TermUI>
+            <String>Parents</String>
+          </Term>
+        </TermList>
+      </Concept>
+    </ConceptList>
+  </DescriptorRecord>
+  <DescriptorRecord DescriptorClass="1">
+    <DescriptorUI>D000002</DescriptorUI>
+    <DescriptorName><String>Child</String></DescriptorName>
+    <TreeNumberList>
+      <TreeNumber>A01.001</TreeNumber>
+      <TreeNumber>A01.002</TreeNumber>
+    </TreeNumberList>
+    <ConceptList>
+      <Concept PreferredConceptYN="Y">
+        <ConceptUI>M000002</ConceptUI>
+        <ConceptName><String>Child</String></ConceptName>
+        <SemanticTypeList>
+          <SemanticType>
+            <SemanticTypeUI>T023</SemanticTypeUI>
+          </SemanticType>
+        </SemanticTypeList>
+        <TermList>
+          <Term ConceptPreferredTermYN="Y">
+            <TermUI>T000003</TermUI>
+            <String>Child</String>
+          </Term>
+        </TermList>
+      </Concept>
+    </ConceptList>
+  </DescriptorRecord>
+</DescriptorRecordSet>
+"""
+
+
+class TestMeSH(unittest.TestCase):
+    """Tests for MeSH."""
+
+    def setUp(self) -> None:
+        """Write a small descriptor file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("desc.gz")
+        with gzip.open(self.path, "wt") as file:
+            file.write(DESCRIPTORS)
+
+    def tearDown(self) -> None:
+        """Remove the descriptor file."""
+        self.directory.cleanup()
+
+    def test_descriptor_records(self):
+        """Test parsing the descriptor records in a parsed root element."""
+        records = get_descriptor_records(
+            ElementTree.fromstring(DESCRIPTORS),
+            id_key="DescriptorUI",
+            name_key="DescriptorName/String",
+        )
+        self._check_records(records)
+
+    def test_iterparse_descriptor_records(self):
+        """Test streaming descriptor records are parsed in this process by default."""
+        with mock.patch("pyobo.sources.mesh.ProcessPoolExecutor") as mock_executor:
+            records = get_descriptor_records(
+                iterparse_xml_gz(self.path, tag="DescriptorRecord"),
+                id_key="DescriptorUI",
+                name_key="DescriptorName/String",
+            )
+        self.assertFalse(mock_executor.called)
+        self._check_records(records)
+
+    def test_iterparse_descriptor_records_stdlib(self):
+        """Test streaming descriptor records without lxml."""
+        with mock.patch.object(io, "lxml_etree", None):
+            records = get_descriptor_records(
+                iterparse_xml_gz(self.path, tag="DescriptorRecord"),
+                id_key="DescriptorUI",
+                name_key="DescriptorName/String",
+            )
+        self._check_records(records)
+
+    def test_descriptor_records_batched(self):
+        """Test parsing descriptor records in worker processes."""
+        records = get_descriptor_records(
+            iterparse_xml_gz(self.path, tag="DescriptorRecord"),
+            id_key="DescriptorUI",
+            name_key="DescriptorName/String",
+            batch_size=1,
+            max_workers=2,
+        )
+        self._check_records(records)
+
+    def _check_records(self, records):
+        self.assertEqual(2, len(records))
+        parent, child = records
+
+        self.assertEqual("D000001", parent["identifier"])
+        self.assertEqual("Parent", parent["name"])
+        self.assertEqual(["A01"], parent["tree_numbers"])
+        self.assertEqual([], parent["parents"])
+        self.assertEqual(1, len(parent["concepts"]))
+        concept = parent["concepts"][0]
+        self.assertEqual("M000001", concept["concept_ui"])
+        self.assertEqual("A parent.", concept["ScopeNote"])
+        self.assertEqual("Y", concept["PreferredConceptYN"])
+        self.assertEqual(["Parent", "Parents"], [term["name"] for term in concept["terms"]])
+
+        self.assertEqual("D000002", child["identifier"])
+        self.assertEqual(["A01.001", "A01.002"], child["tree_numbers"])
+        self.assertEqual(["D000001"], child["parents"])
+        self.assertEqual(["T023"], child["concepts"][0]["semantic_types"])
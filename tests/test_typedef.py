@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for typedefs."""
+
+import copy
+import io
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from unittest import mock
+
+from pyobo import Reference
+from pyobo.struct.typedef import (
+    TypeDef,
+    _DEFAULT_TYPEDEFS,
+    _get_default_factory,
+    _get_default_typedefs,
+    _typedef_from_reference,
+    default_typedefs,
+    get_reference_tuple,
+    has_role,
+    part_of,
+)
+
+
+class TestTypeDef(unittest.TestCase):
+    """Tests for typedefs."""
+
+    def setUp(self) -> None:
+        """Set up a typedef with all of the fields that are written to OBO."""
+        self.typedef = TypeDef(
+            reference=Reference(prefix="RO", identifier="0000001", name="test relation"),
+            namespace="test",
+            comment="a comment",
+            xrefs=(
+                Reference(prefix="BFO", identifier="0000001"),
+                Reference(prefix="x", identifier="y"),
+            ),
+            is_transitive=True,
+            is_symmetric=False,
+        )
+
+    def test_slots(self):
+        """Test the typedef doesn't have a dictionary."""
+        self.assertFalse(hasattr(self.typedef, "__dict__"))
+
+    def test_frozen(self):
+        """Test fields, caches, and new attributes can't be set."""
+        for name in ["comment", "_hash", "_pair", "_obo_lines", "nope"]:
+            with self.subTest(name=name), self.assertRaises(FrozenInstanceError):
+                setattr(self.typedef, name, "value")
+        with self.assertRaises(FrozenInstanceError):
+            del self.typedef.comment
+
+    def test_cache(self):
+        """Test the hash and pair are cached and stay the same."""
+        self.assertEqual(hash((TypeDef, "RO", "0000001")), hash(self.typedef))
+        self.assertEqual(hash(self.typedef), hash(self.typedef))
+        self.assertEqual(("RO", "0000001"), self.typedef.pair)
+        self.assertIs(self.typedef.pair, self.typedef.pair)
+
+    def test_copy(self):
+        """Test pickling and copying, before and after the caches are filled."""
+        for fill in [False, True]:
+            typedef = TypeDef(reference=Reference(prefix="RO", identifier="0000002"))
+            if fill:
+                self.assertIsInstance(hash(typedef), int)
+                self.assertEqual(("RO", "0000002"), typedef.pair)
+                self.assertTrue(typedef.obo_lines())
+            for f in [copy.copy, copy.deepcopy, lambda t: pickle.loads(pickle.dumps(t))]:
+                with self.subTest(fill=fill, f=f):
+                    rv = f(typedef)
+                    self.assertEqual(typedef, rv)
+                    self.assertEqual(hash(typedef), hash(rv))
+                    self.assertEqual(typedef.obo_lines(), rv.obo_lines())
+
+    def test_obo_lines(self):
+        """Test the OBO lines and writing them."""
+        expected = [
+            "\n[Typedef]",
+            "id: RO:0000001",
+            "name: test relation",
+            "namespace: test",
+            "comment: a comment",
+            "xref: BFO:0000001",
+            "xref: x:y",
+            "is_transitive: true",
+            "is_symmetric: false",
+        ]
+        self.assertEqual(expected, list(self.typedef.obo_lines()))
+        self.assertEqual(expected, list(self.typedef.iterate_obo_lines()))
+
+        file = io.StringIO()
+        self.typedef.write_obo_lines(file.write)
+        part_of.write_obo_lines(file.write)
+        expected_text = "".join(
+            f"{line}\n"
+            for line in [*self.typedef.iterate_obo_lines(), *part_of.iterate_obo_lines()]
+        )
+        self.assertEqual(expected_text, file.getvalue())
+
+    def test_from_reference(self):
+        """Test making a typedef without ``__init__`` is the same as with it."""
+        reference = Reference(prefix="RO", identifier="0000003", name="test")
+        expected = TypeDef(reference=reference)
+        for typedef in [
+            _typedef_from_reference(reference),
+            TypeDef.from_triple("RO", "0000003", "test"),
+        ]:
+            with self.subTest(typedef=typedef):
+                self.assertEqual(expected, typedef)
+                self.assertEqual(repr(expected), repr(typedef))
+                self.assertEqual(expected.obo_lines(), typedef.obo_lines())
+                with self.assertRaises(FrozenInstanceError):
+                    typedef.comment = "value"
+
+    def test_default_factory(self):
+        """Test getting the defaults of fields, including ones made by a factory."""
+
+        @dataclass
+        class Example:
+            required: str
+            default: int = 1
+            factory: list = field(default_factory=list)
+
+        required, default, factory = fields(Example)
+        self.assertEqual(1, _get_default_factory(default)())
+        self.assertEqual([], _get_default_factory(factory)())
+        self.assertIsNot(_get_default_factory(factory)(), _get_default_factory(factory)())
+        with self.assertRaises(TypeError):
+            _get_default_factory(required)
+
+    def test_default_typedefs(self):
+        """Test the relation ontology is only loaded when the default typedefs are used."""
+        _get_default_typedefs.cache_clear()
+        try:
+            with mock.patch(
+                "pyobo.struct.typedef.load_ro",
+                return_value={
+                    ("ro", "9999999"): "test relation",
+                    has_role.pair: "has role",
+                    ("ro", "9999998"): "another relation",
+                },
+            ) as mock_load_ro:
+                self.assertFalse(mock_load_ro.called)
+                self.assertIn(("ro", "9999999"), default_typedefs)
+                self.assertNotIn(("ro", "nope"), default_typedefs)
+                self.assertEqual(len(_DEFAULT_TYPEDEFS) + 2, len(default_typedefs))
+                # the extra relations keep the order they're loaded in
+                self.assertEqual(
+                    [("ro", "9999999"), ("ro", "9999998")],
+                    list(default_typedefs)[len(_DEFAULT_TYPEDEFS) :],
+                )
+                self.assertEqual(1, mock_load_ro.call_count)
+                self.assertEqual("test relation", default_typedefs["ro", "9999999"].name)
+                # the explicit typedefs take priority
+                for typedef in _DEFAULT_TYPEDEFS:
+                    self.assertIs(typedef, default_typedefs[typedef.pair])
+        finally:
+            _get_default_typedefs.cache_clear()
+
+    def test_get_reference_tuple(self):
+        """Test getting reference tuples."""
+        self.assertEqual(("RO", "0000001"), get_reference_tuple(self.typedef))
+        self.assertEqual(("BFO", "0000050"), get_reference_tuple(part_of.reference))
+        self.assertEqual(("a", "b"), get_reference_tuple(("a", "b")))
+        self.assertEqual(("go", "0000001"), get_reference_tuple("GO:0000001"))
+        with self.assertRaises(ValueError):
+            get_reference_tuple("nope")
+        for relation in [None, 1, ["a", "b"]]:
+            with self.subTest(relation=relation), self.assertRaises(TypeError):
+                get_reference_tuple(relation)
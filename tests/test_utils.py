@@ -2,10 +2,16 @@
 
 """Test iteration tools."""
 
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
 
 from pyobo.identifier_utils import normalize_curie
-from pyobo.utils.iter import iterate_together
+from pyobo.utils.iter import iterate_df_rows, iterate_together
+from pyobo.utils.path import _read_arrow_df, ensure_df, pyarrow
 
 
 class TestIdentifierUtils(unittest.TestCase):
@@ -55,3 +61,38 @@ class TestIterate(unittest.TestCase):
         r = iterate_together(a, b)
         self.assertNotIsInstance(r, list)
         self.assertEqual(rv, list(r))
+
+    def test_df_rows(self):
+        """Test iterating over the rows of a dataframe with None for missing values."""
+        df = pd.DataFrame({"a": ["x", None, "z"], "b": [1.0, 2.0, float("nan")]})
+        self.assertEqual(
+            [("x", 1.0), (None, 2.0), ("z", None)],
+            list(iterate_df_rows(df)),
+        )
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    """Test reading tables with pyarrow."""
+
+    def test_read(self):
+        """Test reading a table with pyarrow gives the same strings and missing values as pandas."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.tsv")
+            path.write_text("# comment\n# comment\nA\tB\tC\n001\t\tx y\n2\tq;r\t\n")
+            # ensure_path gives back a string, so go through ensure_df
+            with mock.patch("pyobo.utils.path.ensure_path", return_value=path.as_posix()):
+                arrow_df = ensure_df("test", url="", header=0, comment="#", use_arrow=True)
+            pandas_df = pd.read_csv(path, sep="\t", comment="#", dtype=str)
+        self.assertEqual(list(pandas_df.columns), list(arrow_df.columns))
+        self.assertTrue(pandas_df.isna().equals(arrow_df.isna()))
+        self.assertEqual(pandas_df.fillna("").values.tolist(), arrow_df.fillna("").values.tolist())
+
+    def test_read_empty(self):
+        """Test reading a file without a header fails the same way as pandas."""
+        with tempfile.TemporaryDirectory() as directory:
+            for text in ("", "# comment\n"):
+                path = Path(directory).joinpath("test.tsv")
+                path.write_text(text)
+                with self.subTest(text=text), self.assertRaises(pd.errors.EmptyDataError):
+                    _read_arrow_df(path.as_posix(), sep="\t", comment="#")